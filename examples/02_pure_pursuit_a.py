@@ -10,11 +10,12 @@ Copyright (c) 2025 ROX Automation - Jev Kuznetsov
 
 import math
 import time
-from dataclasses import asdict
 
+import numpy as np
+
+from rox_control import warmup
 from rox_control.controllers import PurePursuitA
-from rox_control.tools.bicicle_model import BicycleModel, RobotState
-from rox_control.tools.plot import plot_simulation_data
+from rox_control.tools.bicicle_model import BicycleModel
 from rox_control.tools.simulation import (
     SimulationData,
     SimulationState,
@@ -28,9 +29,17 @@ ANIMATE = True  # Set to False to disable animation
 
 
 def run_pure_pursuit_simulation(
-    controller: PurePursuitA, model: BicycleModel, dt: float = 0.01
+    controller: PurePursuitA,
+    model: BicycleModel,
+    dt: float = 0.01,
+    projected_path_every: int = 10,
 ) -> list[SimulationState]:
-    """Run pure pursuit simulation with timeout safety and debug data collection."""
+    """Run pure pursuit simulation with timeout safety and debug data collection.
+
+    The projected path is only recomputed every `projected_path_every` steps
+    (and reused in between) - it is debug visualization data, and computing 30
+    projection points on every simulation step dominated the run time.
+    """
 
     # KISS timeout calculation: track_length / target_velocity * 5
     track_length = 80.0  # 20m square perimeter
@@ -46,9 +55,9 @@ def run_pure_pursuit_simulation(
     print()
 
     # Create initial SimulationState with no debug data
-    initial_state = model.state
-    states = [SimulationState(**asdict(initial_state))]
+    states = [SimulationState.from_robot_state(model.state)]
 
+    projected_path = None
     for step in range(max_steps):
         # Get control command
         control_output = controller.control(model.state)
@@ -62,22 +71,21 @@ def run_pure_pursuit_simulation(
         model.set_control_command(control_output.curvature, control_output.velocity)
         new_state = model.step(dt)
 
-        # Calculate projected path for debug visualization
-        projected_path = None
-        try:
+        # Refresh projected path for debug visualization every N steps,
+        # reusing the previous one in between
+        if step % projected_path_every == 0:
             proj_x, proj_y = model.get_projected_path(distance=8.0, num_points=30)
-            projected_path = list(zip(proj_x, proj_y, strict=False))
-        except Exception:
-            # If projected path calculation fails, continue without it
-            pass
-
-        # Create SimulationState with debug data
-        simulation_state = SimulationState(
-            **asdict(new_state),
-            controller_output=control_output,
-            projected_path=projected_path,
+            projected_path = np.column_stack((proj_x, proj_y))
+
+        # Create SimulationState with debug data - explicit field copy instead
+        # of the asdict/deepcopy round-trip per step
+        states.append(
+            SimulationState.from_robot_state(
+                new_state,
+                controller_output=control_output,
+                projected_path=projected_path,
+            )
         )
-        states.append(simulation_state)
 
     else:
         # Timeout occurred
@@ -87,9 +95,12 @@ def run_pure_pursuit_simulation(
     return states
 
 
-def main() -> None:
+def main(plot: bool = False) -> None:
     """Run the pure pursuit controller example."""
-    t_start = time.time()
+    # Compile JIT kernels before timing starts
+    warmup()
+
+    t_start = time.perf_counter_ns()
 
     # Create 20m x 20m square track
     track = rectangular_track(L=50.0, B=10.0)  # 50m perimeter
@@ -118,24 +129,20 @@ def main() -> None:
     # Run simulation
     states = run_pure_pursuit_simulation(controller, model)
 
-    t_end = time.time()
+    t_end = time.perf_counter_ns()
 
-    # Convert SimulationState list to RobotState list for present_results (legacy compatibility)
-    robot_states = [
-        RobotState(
-            **{
-                k: v
-                for k, v in asdict(state).items()
-                if k in RobotState.__dataclass_fields__
-            }
-        )
-        for state in states
-    ]
-    present_results(robot_states, t_end - t_start)
+    # SimulationState extends RobotState, so no conversion needed
+    present_results(states, (t_end - t_start) * 1e-9)
 
-    # Generate animation for viewing results
+    if not plot:
+        return
+
+    # Generate animation for viewing results. Plot imports are deferred so
+    # the simulation run is not taxed with the matplotlib import cost.
     print("\nStarting animation...")
     try:
+        from rox_control.tools.plot import plot_simulation_data
+
         simulation_data = SimulationData(states=states, track=track)
 
         # Plot using unified interface - same function call, just different animate parameter
@@ -153,4 +160,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plot", action="store_true", help="show animation when done")
+    main(plot=parser.parse_args().plot)
@@ -1,2 +1,3 @@
+from ._jit import warmup  # noqa F401
 from .track import Track  # noqa F401
 from .version import __version__  # noqa F401
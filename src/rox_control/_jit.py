@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Optional Numba JIT support with graceful fallback.
+
+Numeric kernels in this package are written as plain NumPy/math code and
+decorated with `njit`. When numba is installed (via the 'jit' extra) the
+kernels are compiled to native code; otherwise they run as regular Python
+functions with identical results.
+
+Install with JIT compilation:
+    pip install rox-control[jit]
+
+Copyright (c) 2025 ROX Automation - Jev Kuznetsov
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+
+def _njit_fallback(*args: Any, **kwargs: Any) -> Any:
+    """No-op decorator fallback when numba is not installed."""
+    if args and callable(args[0]):
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
+
+
+njit: Any
+prange: Any
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    njit = _njit_fallback
+    prange = range
+
+
+def warmup() -> None:
+    """Trigger JIT compilation of all numeric kernels with tiny dummy inputs.
+
+    Call once before timing a simulation so first-run measurements reflect the
+    simulation itself, not the compiler. With cache=True kernels this is only
+    expensive on the very first run; without numba it costs microseconds.
+    """
+    import numpy as np
+
+    from rox_control.tools.bicicle_model import (
+        _integrate_maneuver,
+        _simulate_kernel,
+        _step_kernel,
+    )
+    from rox_control.track import _closest_segment_kernel
+
+    xy = np.array([[0.0, 0.0], [1.0, 0.0]])
+    _closest_segment_kernel(xy, 0.5, 0.1)
+
+    state = np.zeros(8)
+    params = np.array([2.5, 1.0, 1.0, 0.5, 10.0])
+    _step_kernel(state, params, 0.01)
+    _integrate_maneuver(state, params, 0.1, 0.0, 0.01, np.empty((2, 8)))
+    _simulate_kernel(state, params, np.zeros((2, 2)), 0.01, np.empty((2, 8)))
+
+
+__all__ = ["HAS_NUMBA", "njit", "prange", "warmup"]
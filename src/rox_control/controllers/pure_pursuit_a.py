@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Pure pursuit A path tracking controller implementation."""
 
+import math
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
 from rox_vectors import Vector
 
 from rox_control.track import Track
@@ -12,7 +14,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from rox_control.tools.bicicle_model import RobotState
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ControlOutput:
     """Structured control output from path tracking controllers."""
 
@@ -50,25 +52,30 @@ class Controller:
 
         Returns: ControlOutput with curvature and velocity commands.
         """
-        if self._track is None:
+        track = self._track
+        if track is None:
             raise ValueError("No track set. Call set_track() first.")
 
-        # Convert robot position to Vector
-        robot_xy = Vector(robot_state.x, robot_state.y)
+        # Work on plain floats in the hot path; box into Vector only at the
+        # API edge to avoid per-step object allocations. Instance attributes
+        # are bound to locals once per call
+        rx = robot_state.x
+        ry = robot_state.y
         robot_heading = robot_state.theta
+        velocity_vector_length = self.velocity_vector_length
 
-        # Find closest segment and project robot onto track
-        segment_idx, projected_point, distance_along = self._track.find_closest_segment(
-            robot_xy
-        )
+        # Find closest segment and project robot onto track (raw-float
+        # variant - the projected point itself is not needed here)
+        segment_idx, _, _, distance_along = track.find_closest_segment_xy(rx, ry)
 
         # Get target point using lookahead distance
         target_point, track_complete = self._get_lookahead_point(
-            segment_idx, distance_along, self.look_ahead_distance
+            track, segment_idx, distance_along, self.look_ahead_distance
         )
 
         # Check if track is complete
         if track_complete:
+            robot_xy = Vector(rx, ry)
             return ControlOutput(
                 curvature=0.0,
                 velocity=0.0,
@@ -78,10 +85,15 @@ class Controller:
                 track_complete=True,
             )
 
-        # Calculate future position and angle error
-        velocity_vector = Vector.from_polar(self.velocity_vector_length, robot_heading)
-        future_position = robot_xy + velocity_vector
-        angle_error = velocity_vector.angle(target_point - robot_xy)
+        # Velocity vector components (was Vector.from_polar)
+        vdx = velocity_vector_length * math.cos(robot_heading)
+        vdy = velocity_vector_length * math.sin(robot_heading)
+
+        # Signed angle from velocity vector to target direction via a single
+        # atan2 of cross/dot (was velocity_vector.angle(target - robot))
+        tdx = target_point.x - rx
+        tdy = target_point.y - ry
+        angle_error = -math.atan2(vdx * tdy - vdy * tdx, vdx * tdx + vdy * tdy)
 
         # Calculate curvature command using proportional control
         curvature = self._proportional_control(0.0, angle_error)
@@ -90,11 +102,67 @@ class Controller:
             curvature=curvature,
             velocity=self.target_speed,
             target_point=target_point,
-            future_position=future_position,
+            future_position=Vector(rx + vdx, ry + vdy),
             angle_error=angle_error,
             track_complete=False,
         )
 
+    def control_batch(
+        self, xs: np.ndarray, ys: np.ndarray, thetas: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Evaluate the controller for a whole batch of robot states at once.
+
+        Intended for offline analysis and replay: all closest-segment
+        projections, lookahead targets and angle errors are computed with
+        broadcast NumPy ops in one pass instead of per-tick control() calls.
+        Ticks where the lookahead runs past the track end get zero curvature
+        and their own position as target, matching control()'s completion
+        behavior.
+
+        Returns: Tuple of (curvatures, targets_x, targets_y, angle_errors).
+        """
+        track = self._track
+        if track is None:
+            raise ValueError("No track set. Call set_track() first.")
+
+        xy = track.xy
+        cum_len = track.cum_len
+        seg_dir = track.seg_dir
+
+        # Closest segment per state: project every state onto every segment
+        # via broadcasting, then argmin over the segment axis
+        a = xy[None, :-1, :]  # (1, M-1, 2)
+        ab = xy[None, 1:, :] - a
+        robots = np.stack((xs, ys), axis=1)[:, None, :]  # (N, 1, 2)
+        ab2 = (ab * ab).sum(axis=2)
+        t = ((robots - a) * ab).sum(axis=2) / ab2
+        proj = a + t[:, :, None] * ab
+        d2 = ((proj - robots) ** 2).sum(axis=2)
+        idx = d2.argmin(axis=1)
+
+        n = np.arange(len(idx))
+        distance_along = np.abs(t[n, idx]) * np.sqrt(ab2[0, idx])
+
+        # Lookahead via arc length, mirroring _get_lookahead_point
+        target_arclen = cum_len[idx] + distance_along + self.look_ahead_distance
+        complete = target_arclen >= cum_len[-1]
+        j = np.searchsorted(cum_len, target_arclen, side="right") - 1
+        j = np.clip(j, 0, len(cum_len) - 2)
+        local = target_arclen - cum_len[j]
+        targets_x = np.where(complete, xs, xy[j, 0] + seg_dir[j, 0] * local)
+        targets_y = np.where(complete, ys, xy[j, 1] + seg_dir[j, 1] * local)
+
+        # Batched angle error and proportional curvature command
+        vdx = self.velocity_vector_length * np.cos(thetas)
+        vdy = self.velocity_vector_length * np.sin(thetas)
+        tdx = targets_x - xs
+        tdy = targets_y - ys
+        angle_errors = -np.arctan2(vdx * tdy - vdy * tdx, vdx * tdx + vdy * tdy)
+        angle_errors = np.where(complete, 0.0, angle_errors)
+        curvatures = -self.proportional_gain * angle_errors
+
+        return curvatures, targets_x, targets_y, angle_errors
+
     def _proportional_control(self, target: float, current: float) -> float:
         """Proportional controller for angle error correction.
 
@@ -103,49 +171,33 @@ class Controller:
         return self.proportional_gain * (target - current)
 
     def _get_lookahead_point(
-        self, segment_idx: int, distance_along_segment: float, lookahead_distance: float
+        self,
+        track: Track,
+        segment_idx: int,
+        distance_along_segment: float,
+        lookahead_distance: float,
     ) -> tuple[Vector, bool]:
         """Get target point at lookahead distance ahead on track.
 
+        Resolved in O(1) by converting the current position to absolute arc
+        length and jumping to the target segment with a searchsorted on the
+        track's precomputed cumulative arc-length array, instead of walking
+        segment by segment.
+
         Returns: Tuple of (target_point, track_complete).
         """
-        if self._track is None:
-            raise ValueError("No track set")
-
-        if segment_idx >= len(self._track) - 1:
-            # Already at or past the last segment
-            return self._track[-1], True
-
-        remaining_lookahead = lookahead_distance
-        current_segment_idx = segment_idx
-        current_distance_along = distance_along_segment
-
-        # Start from current position on current segment
-        while current_segment_idx < len(self._track) - 1:
-            waypoint_a = self._track[current_segment_idx]
-            waypoint_b = self._track[current_segment_idx + 1]
-            segment_vector = waypoint_b - waypoint_a
-            segment_length = abs(segment_vector)
-
-            # Remaining distance in current segment
-            remaining_in_segment = segment_length - current_distance_along
-
-            if remaining_lookahead <= remaining_in_segment:
-                # Target point is within current segment
-                if segment_length > 0:
-                    segment_direction = segment_vector / segment_length
-                    target_distance_along = current_distance_along + remaining_lookahead
-                    target_point = (
-                        waypoint_a + segment_direction * target_distance_along
-                    )
-                else:
-                    target_point = waypoint_a
-                return target_point, False
-
-            # Move to next segment
-            remaining_lookahead -= remaining_in_segment
-            current_segment_idx += 1
-            current_distance_along = 0.0
-
-        # Lookahead extends beyond track end
-        return self._track[-1], True
+        cum_len = track.cum_len
+        target_arclen = (
+            cum_len[segment_idx] + distance_along_segment + lookahead_distance
+        )
+
+        if target_arclen >= cum_len[-1]:
+            # Lookahead extends beyond track end
+            return Vector(track.xy[-1, 0], track.xy[-1, 1]), True
+
+        j = int(np.searchsorted(cum_len, target_arclen, side="right")) - 1
+        local = target_arclen - cum_len[j]
+        target_x = track.xy[j, 0] + track.seg_dir[j, 0] * local
+        target_y = track.xy[j, 1] + track.seg_dir[j, 1] * local
+
+        return Vector(target_x, target_y), False
@@ -14,11 +14,16 @@ Without visualization tools:
 Copyright (c) 2025 ROX Automation - Jev Kuznetsov
 """
 
-from typing import Callable
+from collections.abc import Callable
 
 # Always available tools (no extra dependencies)
-from .bicicle_model import BicycleModel, RobotState
-from .simulation import SimulationData, SimulationState, present_results
+from .bicicle_model import BatchedBicycleModel, BicycleModel, RobotState
+from .simulation import (
+    SimulationData,
+    SimulationState,
+    TrajectoryBuffer,
+    present_results,
+)
 from .tracks import generate_track, rectangular_track
 
 # Matplotlib-dependent tools with graceful fallback
@@ -51,10 +56,12 @@ __all__ = [
     # Utility flag
     "HAS_VISUALIZATION",
     # Simulation and modeling
+    "BatchedBicycleModel",
     "BicycleModel",
     "RobotState",
     "SimulationData",
     "SimulationState",
+    "TrajectoryBuffer",
     # Track generation
     "generate_track",
     "plot_simulation_data",
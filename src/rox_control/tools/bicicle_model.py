@@ -6,12 +6,132 @@ Copyright (c) 2025 ROX Automation - Jev Kuznetsov
 """
 
 import math
+from collections.abc import Callable
 from dataclasses import dataclass
 
 import numpy as np
 
+from rox_control._jit import njit
 
-@dataclass(frozen=True)
+# Column layout of trajectory buffers produced by the integration kernels
+COL_X, COL_Y, COL_THETA, COL_V, COL_STEER, COL_TIME, COL_FRONT_X, COL_FRONT_Y = range(8)
+
+_DEFAULT_STEERING_LIMIT = math.radians(45)
+
+
+@njit(cache=True, fastmath=True)  # type: ignore[misc]
+def _rate_limit(val: float, setpoint: float, roc: float, dt: float) -> float:
+    """Move value toward setpoint at limited rate of change.
+
+    Returns: Updated value.
+    """
+    cap = roc * dt
+    return val + max(-cap, min(cap, setpoint - val))
+
+
+@njit(cache=True, fastmath=True)  # type: ignore[misc]
+def _step_kernel(state: np.ndarray, params: np.ndarray, dt: float) -> None:
+    """Advance one bicycle kinematics step, writing the state array in place.
+
+    `state` is a length-8 float64 array with the COL_* layout, `params` is
+    (wheelbase, accel, steering_speed, max_steering_angle, max_velocity).
+    Setpoints for velocity and steering are carried in the state array's
+    COL_V/COL_STEER entries by the caller via `_integrate_maneuver`.
+    """
+    wheelbase = params[0]
+
+    v = state[COL_V]
+    phi = state[COL_STEER]
+    theta = state[COL_THETA]
+
+    # Apply bicycle kinematics (forward integration)
+    # ẋ = v cos(θ),  ẏ = v sin(θ),  θ̇ = (v/l) tan(φ)
+    cos_theta = math.cos(theta)
+    sin_theta = math.sin(theta)
+    state[COL_X] += v * cos_theta * dt
+    state[COL_Y] += v * sin_theta * dt
+    state[COL_THETA] += (v / wheelbase) * math.tan(phi) * dt
+    state[COL_TIME] += dt
+
+    new_theta = state[COL_THETA]
+    state[COL_FRONT_X] = state[COL_X] + wheelbase * math.cos(new_theta)
+    state[COL_FRONT_Y] = state[COL_Y] + wheelbase * math.sin(new_theta)
+
+
+@njit(cache=True, fastmath=True)  # type: ignore[misc]
+def _integrate_maneuver(
+    state: np.ndarray,
+    params: np.ndarray,
+    target_v: float,
+    target_steer: float,
+    dt: float,
+    out: np.ndarray,
+) -> None:
+    """Integrate a maneuver, writing each step into the (n_steps, 8) `out` buffer.
+
+    The output rows use the COL_* column layout; `state` is updated in place.
+    """
+    accel = params[1]
+    steering_speed = params[2]
+    max_steer = params[3]
+    max_v = params[4]
+
+    # Setpoints are clamped once, mirroring LinearModel.setpoint behaviour
+    target_v = max(-max_v, min(max_v, target_v))
+    target_steer = max(-max_steer, min(max_steer, target_steer))
+
+    for i in range(out.shape[0]):
+        state[COL_V] = max(
+            -max_v, min(max_v, _rate_limit(state[COL_V], target_v, accel, dt))
+        )
+        state[COL_STEER] = max(
+            -max_steer,
+            min(
+                max_steer,
+                _rate_limit(state[COL_STEER], target_steer, steering_speed, dt),
+            ),
+        )
+        _step_kernel(state, params, dt)
+        out[i] = state
+
+
+@njit(cache=True, fastmath=True)  # type: ignore[misc]
+def _simulate_kernel(
+    state: np.ndarray,
+    params: np.ndarray,
+    targets: np.ndarray,
+    dt: float,
+    out: np.ndarray,
+) -> None:
+    """Integrate a run with per-step setpoints into the (n_steps, 8) `out` buffer.
+
+    `targets` is an (n_steps, 2) array of (velocity, steering angle)
+    setpoints, one row per step; `state` is updated in place.
+    """
+    accel = params[1]
+    steering_speed = params[2]
+    max_steer = params[3]
+    max_v = params[4]
+
+    for i in range(out.shape[0]):
+        target_v = max(-max_v, min(max_v, targets[i, 0]))
+        target_steer = max(-max_steer, min(max_steer, targets[i, 1]))
+
+        state[COL_V] = max(
+            -max_v, min(max_v, _rate_limit(state[COL_V], target_v, accel, dt))
+        )
+        state[COL_STEER] = max(
+            -max_steer,
+            min(
+                max_steer,
+                _rate_limit(state[COL_STEER], target_steer, steering_speed, dt),
+            ),
+        )
+        _step_kernel(state, params, dt)
+        out[i] = state
+
+
+@dataclass(frozen=True, slots=True)
 class RobotState:
     """Represents the state of the robot in the simulation"""
 
@@ -56,16 +176,10 @@ class LinearModel:
 
     def step(self, dt: float) -> None:
         """Update value toward setpoint at limited rate"""
-        error: float = self._setpoint - self.val
-        step: float = math.copysign(1, error) * self.roc * dt
-
-        if abs(step) > abs(error):
-            self.val += error
-        else:
-            self.val += step
+        new_val: float = _rate_limit(self.val, self._setpoint, self.roc, dt)
 
         # Apply limits
-        self.val = max(self.min_val, min(self.max_val, self.val))
+        self.val = max(self.min_val, min(self.max_val, new_val))
 
 
 class BicycleModel:
@@ -107,6 +221,11 @@ class BicycleModel:
             max_val=max_steering_angle,
         )
 
+        # Scratch buffers reused by every kernel call so the per-step path
+        # performs no array allocations
+        self._state_buf: np.ndarray = np.zeros(8, dtype=np.float64)
+        self._params_buf: np.ndarray = np.zeros(5, dtype=np.float64)
+
     def set_target_velocity(self, target_velocity: float) -> None:
         """Set target linear velocity"""
         self.velocity_model.setpoint = target_velocity
@@ -133,6 +252,51 @@ class BicycleModel:
         self.set_target_velocity(velocity)
         self.set_target_steering_angle(steering_angle)
 
+    def _state_array(self) -> np.ndarray:
+        """Pack current state into the reused length-8 buffer with COL_* layout.
+
+        Returns: State array for the integration kernels.
+        """
+        s = self.state
+        buf = self._state_buf
+        buf[COL_X] = s.x
+        buf[COL_Y] = s.y
+        buf[COL_THETA] = s.theta
+        buf[COL_V] = self.velocity_model.val
+        buf[COL_STEER] = self.steering_model.val
+        buf[COL_TIME] = s.time
+        buf[COL_FRONT_X] = s.front_x
+        buf[COL_FRONT_Y] = s.front_y
+        return buf
+
+    def _params_array(self) -> np.ndarray:
+        """Pack model parameters into the reused buffer for the integration kernels.
+
+        Returns: (wheelbase, accel, steering_speed, max_steering_angle, max_velocity).
+        """
+        buf = self._params_buf
+        buf[0] = self.wheelbase
+        buf[1] = self.velocity_model.roc
+        buf[2] = self.steering_model.roc
+        buf[3] = self.steering_model.max_val
+        buf[4] = self.velocity_model.max_val
+        return buf
+
+    def _update_from_array(self, state_arr: np.ndarray) -> None:
+        """Sync dataclass state and linear models from a kernel state array."""
+        self.state = RobotState(
+            x=state_arr[COL_X],
+            y=state_arr[COL_Y],
+            theta=state_arr[COL_THETA],
+            v=state_arr[COL_V],
+            steering_angle=state_arr[COL_STEER],
+            time=state_arr[COL_TIME],
+            front_x=state_arr[COL_FRONT_X],
+            front_y=state_arr[COL_FRONT_Y],
+        )
+        self.velocity_model.val = self.state.v
+        self.steering_model.val = self.state.steering_angle
+
     def step(self, dt: float) -> RobotState:
         """Perform simulation step using bicycle kinematics
 
@@ -146,44 +310,109 @@ class BicycleModel:
         self.velocity_model.step(dt)
         self.steering_model.step(dt)
 
-        # Get current state values
-        v = self.velocity_model.val
-        phi = self.steering_model.val
-        x, y, theta = self.state.x, self.state.y, self.state.theta
+        # Integrate kinematics in the shared kernel
+        state_arr = self._state_array()
+        _step_kernel(state_arr, self._params_array(), dt)
+        self._update_from_array(state_arr)
 
-        # Apply bicycle kinematics (forward integration)
-        # ẋ = v cos(θ)
-        # ẏ = v sin(θ)
-        # θ̇ = (v/l) tan(φ)
-        x_dot = v * math.cos(theta)
-        y_dot = v * math.sin(theta)
-        theta_dot = (v / self.wheelbase) * math.tan(phi)
-
-        # Integrate position and orientation
-        new_x = x + x_dot * dt
-        new_y = y + y_dot * dt
-        new_theta = theta + theta_dot * dt
+        return self.state
 
-        # Update simulation time
-        new_time = self.state.time + dt
+    def make_stepper(self, dt: float) -> Callable[[], RobotState]:
+        """Build a zero-argument stepper specialized for a fixed time step.
 
-        # Calculate front wheel position
-        front_x = new_x + self.wheelbase * math.cos(new_theta)
-        front_y = new_y + self.wheelbase * math.sin(new_theta)
+        Hoists the linear models, kernel buffers and a private snapshot of the
+        parameter array into closure locals, so tight scalar loops pay no
+        per-call attribute lookups or parameter repacking. Each call is
+        equivalent to step(dt).
 
-        # Create new state
-        self.state = RobotState(
-            x=new_x,
-            y=new_y,
-            theta=new_theta,
-            v=v,
-            steering_angle=phi,
-            time=new_time,
-            front_x=front_x,
-            front_y=front_y,
+        Returns: Callable advancing the model one step and returning the state.
+        """
+        velocity_model = self.velocity_model
+        steering_model = self.steering_model
+        pack_state = self._state_array
+        sync_state = self._update_from_array
+        # Model parameters are fixed for the model's lifetime - snapshot once
+        params = self._params_array().copy()
+
+        def stepper() -> RobotState:
+            velocity_model.step(dt)
+            steering_model.step(dt)
+            state_arr = pack_state()
+            _step_kernel(state_arr, params, dt)
+            sync_state(state_arr)
+            return self.state
+
+        return stepper
+
+    def integrate_maneuver(
+        self,
+        target_velocity: float,
+        target_steering_angle: float,
+        dt: float,
+        n_steps: int,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Integrate a full maneuver in a single kernel call.
+
+        Equivalent to setting targets and calling step() n_steps times, but the
+        whole loop runs inside the JIT-compiled kernel without per-step Python
+        dispatch. When `out` is given (an (n_steps, 8) view, e.g. from
+        TrajectoryBuffer.reserve) the kernel writes into it directly without an
+        intermediate allocation.
+
+        Returns: (n_steps, 8) trajectory buffer with COL_* column layout.
+        """
+        self.set_target_velocity(target_velocity)
+        self.set_target_steering_angle(target_steering_angle)
+
+        if out is None:
+            out = np.empty((n_steps, 8), dtype=np.float64)
+
+        state_arr = self._state_array()
+        _integrate_maneuver(
+            state_arr,
+            self._params_array(),
+            target_velocity,
+            target_steering_angle,
+            dt,
+            out,
         )
+        self._update_from_array(state_arr)
+        return out
 
-        return self.state
+    def simulate(
+        self,
+        targets: np.ndarray,
+        dt: float,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Roll out a whole run with per-step setpoints in one kernel call.
+
+        `targets` is an (n_steps, 2) array of (velocity, steering angle)
+        setpoints applied one row per step - equivalent to calling
+        set_target_velocity/set_target_steering_angle and step() per step,
+        but the loop runs inside the JIT-compiled kernel. When `out` is given
+        (e.g. from TrajectoryBuffer.reserve) the kernel writes into it
+        directly.
+
+        Returns: (n_steps, 8) trajectory buffer with COL_* column layout.
+        """
+        targets = np.asarray(targets, dtype=np.float64)
+        if targets.ndim != 2 or targets.shape[1] != 2:
+            raise ValueError("Expected an (n_steps, 2) setpoint array")
+
+        if out is None:
+            out = np.empty((targets.shape[0], 8), dtype=np.float64)
+
+        state_arr = self._state_array()
+        _simulate_kernel(state_arr, self._params_array(), targets, dt, out)
+        self._update_from_array(state_arr)
+
+        # Keep the linear-model setpoints in sync with the last applied row
+        if targets.shape[0] > 0:
+            self.set_target_velocity(targets[-1, 0])
+            self.set_target_steering_angle(targets[-1, 1])
+        return out
 
     def get_front_wheel_pos(self) -> tuple[float, float]:
         """Get front wheel position based on current state and wheelbase."""
@@ -193,7 +422,7 @@ class BicycleModel:
 
     def get_projected_path(
         self, distance: float = 5.0, num_points: int = 20
-    ) -> tuple[list[float], list[float]]:
+    ) -> tuple[np.ndarray, np.ndarray]:
         """Get projected path based on current steering angle.
 
         Args:
@@ -201,26 +430,33 @@ class BicycleModel:
             num_points: Number of points to generate along the path
 
         Returns:
-            Tuple of (x_coords, y_coords) lists representing the projected path
+            Tuple of (x_coords, y_coords) arrays representing the projected path
         """
+        # Compute heading trig once and reuse for front wheel, straight-line
+        # projection and ICR below
+        theta = self.state.theta
+        cos_theta = math.cos(theta)
+        sin_theta = math.sin(theta)
+
         # Start from front wheel position
-        front_x, front_y = self.get_front_wheel_pos()
+        front_x = self.state.x + self.wheelbase * cos_theta
+        front_y = self.state.y + self.wheelbase * sin_theta
 
         # Create parameter array
         t: np.ndarray = np.linspace(0, 1, num_points)
 
         if abs(self.state.steering_angle) < 0.01:  # Going straight
             d: np.ndarray = t * distance
-            proj_x: np.ndarray = front_x + d * math.cos(self.state.theta)
-            proj_y: np.ndarray = front_y + d * math.sin(self.state.theta)
-            return proj_x.tolist(), proj_y.tolist()
+            proj_x: np.ndarray = front_x + d * cos_theta
+            proj_y: np.ndarray = front_y + d * sin_theta
+            return proj_x, proj_y
 
         # Calculate turning radius for rear wheel
         R_rear: float = self.wheelbase / math.tan(self.state.steering_angle)
 
         # Instantaneous center of rotation (ICR)
-        icr_x: float = self.state.x - R_rear * math.sin(self.state.theta)
-        icr_y: float = self.state.y + R_rear * math.cos(self.state.theta)
+        icr_x: float = self.state.x - R_rear * sin_theta
+        icr_y: float = self.state.y + R_rear * cos_theta
 
         # Calculate radius for front wheel (distance from ICR to front wheel)
         R_front: float = math.sqrt((front_x - icr_x) ** 2 + (front_y - icr_y) ** 2)
@@ -235,4 +471,109 @@ class BicycleModel:
         proj_x = icr_x + R_front * np.cos(angles)
         proj_y = icr_y + R_front * np.sin(angles)
 
-        return proj_x.tolist(), proj_y.tolist()
+        return proj_x, proj_y
+
+
+class BatchedBicycleModel:
+    """Vectorized bicycle model stepping a batch of independent robots at once.
+
+    Holds state as (batch_size,) float64 arrays and advances all robots with
+    ufunc expressions, so parameter sweeps (wheelbase, gains, seeds) run in one
+    vectorized pass instead of looping over BicycleModel instances. Model
+    parameters may be scalars or (batch_size,) arrays.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        wheelbase: float | np.ndarray = 2.5,
+        accel: float | np.ndarray = 1.0,
+        steering_speed: float | np.ndarray = _DEFAULT_STEERING_LIMIT,
+        max_steering_angle: float | np.ndarray = _DEFAULT_STEERING_LIMIT,
+        max_velocity: float | np.ndarray = 10.0,
+    ) -> None:
+        """
+        Args:
+            batch_size: number of independent robots in the batch
+            wheelbase: distance between front and rear axles in meters
+            accel: maximum linear acceleration in m/s^2
+            steering_speed: maximum steering angle change in radians per second
+            max_steering_angle: maximum steering angle in radians
+            max_velocity: maximum velocity in m/s
+        """
+        self.batch_size = batch_size
+        self.wheelbase = np.broadcast_to(
+            np.asarray(wheelbase, dtype=np.float64), (batch_size,)
+        ).copy()
+        self.accel = np.broadcast_to(
+            np.asarray(accel, dtype=np.float64), (batch_size,)
+        ).copy()
+        self.steering_speed = np.broadcast_to(
+            np.asarray(steering_speed, dtype=np.float64), (batch_size,)
+        ).copy()
+        self.max_steering_angle = np.broadcast_to(
+            np.asarray(max_steering_angle, dtype=np.float64), (batch_size,)
+        ).copy()
+        self.max_velocity = np.broadcast_to(
+            np.asarray(max_velocity, dtype=np.float64), (batch_size,)
+        ).copy()
+
+        self.x = np.zeros(batch_size)
+        self.y = np.zeros(batch_size)
+        self.theta = np.zeros(batch_size)
+        self.v = np.zeros(batch_size)
+        self.steering_angle = np.zeros(batch_size)
+        self.time = 0.0
+
+        self._target_v = np.zeros(batch_size)
+        self._target_steer = np.zeros(batch_size)
+
+    def set_targets(
+        self,
+        velocity: float | np.ndarray,
+        steering_angle: float | np.ndarray,
+    ) -> None:
+        """Set target velocity and steering angle for all robots (broadcastable)."""
+        self._target_v = np.clip(velocity, -self.max_velocity, self.max_velocity)
+        self._target_steer = np.clip(
+            steering_angle, -self.max_steering_angle, self.max_steering_angle
+        )
+
+    def step(self, dt: float) -> None:
+        """Advance all robots one time step with vectorized bicycle kinematics."""
+        # Rate-limited velocity and steering updates (vectorized LinearModel)
+        self.v = np.clip(
+            self.v
+            + np.clip(self._target_v - self.v, -self.accel * dt, self.accel * dt),
+            -self.max_velocity,
+            self.max_velocity,
+        )
+        self.steering_angle = np.clip(
+            self.steering_angle
+            + np.clip(
+                self._target_steer - self.steering_angle,
+                -self.steering_speed * dt,
+                self.steering_speed * dt,
+            ),
+            -self.max_steering_angle,
+            self.max_steering_angle,
+        )
+
+        # Bicycle kinematics, same integration order as the scalar kernel
+        self.x = self.x + self.v * np.cos(self.theta) * dt
+        self.y = self.y + self.v * np.sin(self.theta) * dt
+        self.theta = (
+            self.theta + (self.v / self.wheelbase) * np.tan(self.steering_angle) * dt
+        )
+        self.time += dt
+
+    @property
+    def front_xy(self) -> tuple[np.ndarray, np.ndarray]:
+        """Front wheel positions for all robots.
+
+        Returns: Tuple of (front_x, front_y) arrays.
+        """
+        return (
+            self.x + self.wheelbase * np.cos(self.theta),
+            self.y + self.wheelbase * np.sin(self.theta),
+        )
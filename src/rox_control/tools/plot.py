@@ -10,12 +10,16 @@ Copyright (c) 2025 ROX Automation - Jev Kuznetsov
 """
 
 import math
+from contextlib import AbstractContextManager
 from typing import Any
 
-import matplotlib.animation as animation
+import matplotlib as mpl
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib import animation
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
+from matplotlib.patches import FancyArrowPatch
 from matplotlib.widgets import Button
 
 from rox_control.track import Track
@@ -23,6 +27,24 @@ from rox_control.track import Track
 from .bicicle_model import RobotState
 from .simulation import SimulationData, SimulationState
 
+# Static plots down-sample to roughly this many vertices per trace
+_MAX_STATIC_VERTICES = 5000
+
+
+def _render_rc_context() -> AbstractContextManager[None]:
+    """Context applying dense-polyline render settings to all draws inside it.
+
+    Returns: rc context with aggressive vertex simplification and chunked
+    Agg path processing.
+    """
+    return mpl.rc_context(
+        {
+            "path.simplify": True,
+            "path.simplify_threshold": 1.0,
+            "agg.path.chunksize": 10000,
+        }
+    )
+
 
 def plot_simulation_data(
     data: SimulationData,
@@ -119,36 +141,42 @@ def plot_simulation_results(
 
 def _plot_static_data(data: SimulationData) -> None:
     """Plot static simulation data."""
-    # Extract front wheel trajectory from states
-    front_trajectory = [(state.front_x, state.front_y) for state in data.states]
-    rear_trajectory = [(state.x, state.y) for state in data.states]
-
-    # Extract time series data
-    times = [state.time for state in data.states]
-    steering_angles = [math.degrees(state.steering_angle) for state in data.states]
-    velocities = [state.v for state in data.states]
-
+    # Columnar arrays from SimulationData's cached gather - one pass over the
+    # states instead of five per-field list comprehensions, with the degree
+    # conversion done as a single vectorized call
     plot_data = {
-        "rear_trajectory": rear_trajectory,
-        "front_trajectory": front_trajectory,
-        "times": times,
-        "steering_angles": steering_angles,
-        "velocities": velocities,
+        "rear_x": data.x,
+        "rear_y": data.y,
+        "front_x": data.front_x,
+        "front_y": data.front_y,
+        "times": data.time,
+        "steering_angles": data.steering_deg,
+        "velocities": data.v,
     }
 
-    # Create figure with 2-column layout
-    fig, (ax_traj, ax_time_container) = plt.subplots(1, 2, figsize=(15, 6))
+    # Down-sample very long runs - beyond a few thousand vertices the extra
+    # points are invisible at screen resolution but the renderer still walks
+    # every one of them
+    stride = max(1, len(data.states) // _MAX_STATIC_VERTICES)
+    if stride > 1:
+        plot_data = {key: column[::stride] for key, column in plot_data.items()}
 
-    # Left panel: Trajectory plot
-    _plot_trajectory(ax_traj, plot_data, data.track)
+    # Aggressive path simplification while rendering: collinear-ish vertex
+    # runs collapse before they reach the rasterizer
+    with _render_rc_context():
+        # Create figure with 2-column layout
+        fig, (ax_traj, ax_time_container) = plt.subplots(1, 2, figsize=(15, 6))
 
-    # Right panel: Time series plots (2 stacked subplots)
-    _plot_time_series(ax_time_container, plot_data, fig)
+        # Left panel: Trajectory plot
+        _plot_trajectory(ax_traj, plot_data, data.track)
 
-    # Overall styling
-    fig.suptitle("Bicycle Model Simulation Results", fontsize=14, fontweight="bold")
-    plt.tight_layout()
-    plt.show()
+        # Right panel: Time series plots (2 stacked subplots)
+        _plot_time_series(ax_time_container, plot_data, fig)
+
+        # Overall styling
+        fig.suptitle("Bicycle Model Simulation Results", fontsize=14, fontweight="bold")
+        plt.tight_layout()
+        plt.show()
 
 
 def _plot_animated_data(
@@ -169,10 +197,14 @@ def _plot_animated_data(
         target_frames = 75
         frame_skip = max(1, len(states) // target_frames)
 
-    # Create subsampled states for animation
-    animation_states = states[::frame_skip]
-    if states[-1] not in animation_states:  # Ensure we include the final state
-        animation_states.append(states[-1])
+    # Create subsampled states for animation; the stride covers the last
+    # index exactly when (len-1) divides evenly, otherwise append it.
+    # The original index per frame is kept so update() maps frame to state
+    # with one list lookup instead of re-deriving it
+    original_indices = list(range(0, len(states), frame_skip))
+    if original_indices[-1] != len(states) - 1:  # Ensure we include the final state
+        original_indices.append(len(states) - 1)
+    animation_states = [states[i] for i in original_indices]
 
     # Create figure with same 2-column layout as static, but taller for buttons
     fig, (ax_traj, ax_time_container) = plt.subplots(1, 2, figsize=(15, 7))
@@ -184,31 +216,71 @@ def _plot_animated_data(
     ax_velocity = fig.add_subplot(gs[1, 1])
 
     # Setup trajectory plot using existing function (with empty data initially)
+    empty = np.empty(0)
     empty_data: dict[str, Any] = {
-        "rear_trajectory": [],
-        "front_trajectory": [],
-        "times": [],
-        "steering_angles": [],
-        "velocities": [],
+        "rear_x": empty,
+        "rear_y": empty,
+        "front_x": empty,
+        "front_y": empty,
+        "times": empty,
+        "steering_angles": empty,
+        "velocities": empty,
     }
     _plot_trajectory(ax_traj, empty_data, data.track)
 
-    # Calculate bounds for consistent axis limits
-    all_x = [state.x for state in states] + [state.front_x for state in states]
-    all_y = [state.y for state in states] + [state.front_y for state in states]
-
+    # Precompute full-run trajectory and time-series columns once; the bounds
+    # math below and update() only slice these arrays, so per-frame cost is
+    # O(1) instead of rebuilding O(frame) Python lists every frame
+    rear_x_all = data.x
+    rear_y_all = data.y
+    front_x_all = data.front_x
+    front_y_all = data.front_y
+    times_all = data.time
+    steering_deg_all = data.steering_deg
+    theta_deg_all = data.theta_deg
+    velocities_all = data.v
+
+    # Decimate the growing trace/time-series data for very long runs - the
+    # lines only need display-resolution density, while the robot markers
+    # and info text keep reading the full-fidelity columns
+    trace_stride = max(1, len(states) // _MAX_STATIC_VERTICES)
+    rear_x_ds = rear_x_all[::trace_stride]
+    rear_y_ds = rear_y_all[::trace_stride]
+    front_x_ds = front_x_all[::trace_stride]
+    front_y_ds = front_y_all[::trace_stride]
+    times_ds = times_all[::trace_stride]
+    steering_deg_ds = steering_deg_all[::trace_stride]
+    velocities_ds = velocities_all[::trace_stride]
+
+    # Growing traces draw from constant-size NaN-prefilled buffers that are
+    # filled in place as frames advance - Agg skips NaN vertices, so no slice
+    # views are allocated per frame. set_data still runs each frame (the line
+    # cache must be invalidated) but always with these same arrays
+    rear_x_buf = np.full(len(rear_x_ds), np.nan)
+    rear_y_buf = np.full(len(rear_y_ds), np.nan)
+    front_x_buf = np.full(len(front_x_ds), np.nan)
+    front_y_buf = np.full(len(front_y_ds), np.nan)
+    times_buf = np.full(len(times_ds), np.nan)
+    steering_buf = np.full(len(steering_deg_ds), np.nan)
+    velocity_buf = np.full(len(velocities_ds), np.nan)
+
+    # Calculate bounds for consistent axis limits on whole columns (plus the
+    # track's coordinate array) instead of per-state Python lists
+    x_columns = [rear_x_all, front_x_all]
+    y_columns = [rear_y_all, front_y_all]
     if data.track is not None:
-        track_x = [wp.x for wp in data.track.data]
-        track_y = [wp.y for wp in data.track.data]
-        all_x.extend(track_x)
-        all_y.extend(track_y)
+        x_columns.append(data.track.xy[:, 0])
+        y_columns.append(data.track.xy[:, 1])
+
+    all_x = np.concatenate(x_columns)
+    all_y = np.concatenate(y_columns)
 
-    x_range = max(all_x) - min(all_x)
+    x_range = float(np.ptp(all_x))
 
     # Calculate horizontal bounds with margin
     horizontal_margin = x_range * 0.05 + 1.0  # 5% + 1m minimum
-    x_min = min(all_x) - horizontal_margin
-    x_max = max(all_x) + horizontal_margin
+    x_min = float(all_x.min()) - horizontal_margin
+    x_max = float(all_x.max()) + horizontal_margin
     x_span = x_max - x_min
 
     # For animation, we have a 2-column layout, so trajectory plot gets roughly half the figure width
@@ -218,7 +290,7 @@ def _plot_animated_data(
     y_span_for_full_height = x_span / plot_aspect_ratio
 
     # Center the y range around the track, but expand to use full vertical space
-    y_center = (min(all_y) + max(all_y)) / 2
+    y_center = float(all_y.min() + all_y.max()) / 2
     y_min = y_center - y_span_for_full_height / 2
     y_max = y_center + y_span_for_full_height / 2
 
@@ -227,10 +299,10 @@ def _plot_animated_data(
 
     # Initialize dynamic trajectory elements
     (rear_trace,) = ax_traj.plot(
-        [], [], "b-", linewidth=2, label="Rear Wheel", alpha=0.8
+        rear_x_buf, rear_y_buf, "b-", linewidth=2, label="Rear Wheel", alpha=0.8
     )
     (front_trace,) = ax_traj.plot(
-        [], [], "r--", linewidth=2, label="Front Wheel", alpha=0.8
+        front_x_buf, front_y_buf, "r--", linewidth=2, label="Front Wheel", alpha=0.8
     )
     (robot_rear_dot,) = ax_traj.plot([], [], "go", markersize=8, label="Robot Position")
 
@@ -254,26 +326,25 @@ def _plot_animated_data(
             [], [], "c:", linewidth=2, alpha=0.8, label="Projected Path"
         )
 
-    # Heading arrow
-    heading_arrow = ax_traj.annotate(
-        "",
-        xy=(0, 0),
-        xytext=(0, 0),
-        arrowprops={"arrowstyle": "->", "color": "green", "lw": 2},
+    # Heading arrow - a bare patch instead of an empty annotation, so the
+    # per-frame update is a pure set_positions without text-layout work
+    heading_arrow = FancyArrowPatch(
+        (0, 0), (0, 0), arrowstyle="->", color="green", lw=2, mutation_scale=10
     )
+    ax_traj.add_patch(heading_arrow)
 
     ax_traj.legend(loc="best")
 
     # Calculate steering limits based on simulation data
-    max_abs_steering = (
-        max(abs(math.degrees(state.steering_angle)) for state in states)
-        if states
-        else 50.0
-    )
+    max_abs_steering = float(np.abs(steering_deg_all).max())
     steering_limit = max_abs_steering * 1.1  # 110% of max absolute steering
 
+    # Time axes span the whole run up front - blitting caches the axes
+    # background, so per-frame limit changes would leave stale grids/ticks
+    t_end = states[-1].time + 1.0
+
     # Setup time series plots
-    ax_steering.set_xlim(0, 10)  # Rolling window
+    ax_steering.set_xlim(0, t_end)
     ax_steering.set_ylim(-steering_limit, steering_limit)  # Symmetric limits
     ax_steering.grid(True, alpha=0.3)
     ax_steering.set_ylabel("Steering Angle (°)")
@@ -281,18 +352,18 @@ def _plot_animated_data(
     ax_steering.tick_params(labelbottom=False)
 
     # Calculate velocity limits based on simulation data
-    max_velocity = max(state.v for state in states) if states else 20.0
+    max_velocity = float(velocities_all.max())
     velocity_limit = max_velocity * 1.1  # 110% of max velocity
 
-    ax_velocity.set_xlim(0, 10)  # Rolling window
+    ax_velocity.set_xlim(0, t_end)
     ax_velocity.set_ylim(0, velocity_limit)
     ax_velocity.grid(True, alpha=0.3)
     ax_velocity.set_xlabel("Time (s)")
     ax_velocity.set_ylabel("Velocity (m/s)")
     ax_velocity.set_title("Speed Profile")
 
-    (steering_line,) = ax_steering.plot([], [], "g-", linewidth=2)
-    (velocity_line,) = ax_velocity.plot([], [], "m-", linewidth=2)
+    (steering_line,) = ax_steering.plot(times_buf, steering_buf, "g-", linewidth=2)
+    (velocity_line,) = ax_velocity.plot(times_buf, velocity_buf, "m-", linewidth=2)
 
     ax_steering.sharex(ax_velocity)
 
@@ -312,6 +383,7 @@ def _plot_animated_data(
         def __init__(self) -> None:
             self.is_paused = False
             self.current_frame = 0
+            self.filled = 0  # trace buffer elements filled so far
             self.anim: animation.FuncAnimation | None = None
 
     anim_state = AnimationState()
@@ -382,10 +454,57 @@ def _plot_animated_data(
     btn_step_forward.on_clicked(step_forward)
     btn_stop.on_clicked(stop_animation)
 
+    # Gather per-frame controller targets and projected paths once; update()
+    # then only indexes by frame instead of walking nested attributes.
+    # NaN marks frames without an active target (no output or track complete)
+    frame_target_x = np.full(len(animation_states), np.nan)
+    frame_target_y = np.full(len(animation_states), np.nan)
+    if has_controller_data:
+        for i, anim_state_i in enumerate(animation_states):
+            output = anim_state_i.controller_output
+            if output is not None and not output.track_complete:
+                frame_target_x[i] = output.target_point.x
+                frame_target_y[i] = output.target_point.y
+    projected_arrs = [s.projected_path for s in animation_states]
+
+    # Refresh the info text only every few frames - building the multi-line
+    # string costs several float formats per frame and reads fine at 1/5 rate
+    info_text_stride = 5
+
+    # Preformat debug lines in one pass and throttle printing - terminal I/O
+    # per frame can stall the GUI thread at animation rate
+    debug_print_stride = 10
+    debug_lines: list[str] = []
+    if show_debug_info:
+        debug_lines = [
+            f"Frame {i:3d}: pos=({s.x:6.2f}, {s.y:6.2f}), "
+            f"θ={math.degrees(s.theta):6.1f}°"
+            for i, s in enumerate(animation_states)
+        ]
+
+    # Artists redrawn per frame when blitting; everything else (track, grids,
+    # legend, buttons) lives in the cached background and is never redrawn
+    blit_artists = tuple(
+        artist
+        for artist in (
+            rear_trace,
+            front_trace,
+            robot_rear_dot,
+            heading_arrow,
+            target_dot,
+            lookahead_line,
+            projected_path_line,
+            steering_line,
+            velocity_line,
+            info_text,
+        )
+        if artist is not None
+    )
+
     def update(frame_idx: int) -> tuple:
         """Update function for animation."""
         if frame_idx >= len(animation_states):
-            return ()
+            return blit_artists
 
         # Update current frame state for manual control
         anim_state.current_frame = frame_idx
@@ -393,91 +512,102 @@ def _plot_animated_data(
         current_state = animation_states[frame_idx]
 
         # Find corresponding index in original states for trajectory building
-        original_idx = min(frame_idx * frame_skip, len(states) - 1)
+        original_idx = original_indices[frame_idx]
+        end = original_idx + 1
+        end_ds = (end + trace_stride - 1) // trace_stride
+
+        # Advance the NaN-prefilled trace buffers to the current frame; only
+        # newly covered elements are touched. On rewind (step back or loop
+        # restart) the no-longer-covered tail is re-blanked instead
+        filled = anim_state.filled
+        if end_ds < filled:
+            gap = slice(end_ds, filled)
+            rear_x_buf[gap] = np.nan
+            rear_y_buf[gap] = np.nan
+            front_x_buf[gap] = np.nan
+            front_y_buf[gap] = np.nan
+            times_buf[gap] = np.nan
+            steering_buf[gap] = np.nan
+            velocity_buf[gap] = np.nan
+        elif end_ds > filled:
+            new = slice(filled, end_ds)
+            rear_x_buf[new] = rear_x_ds[new]
+            rear_y_buf[new] = rear_y_ds[new]
+            front_x_buf[new] = front_x_ds[new]
+            front_y_buf[new] = front_y_ds[new]
+            times_buf[new] = times_ds[new]
+            steering_buf[new] = steering_deg_ds[new]
+            velocity_buf[new] = velocities_ds[new]
+        anim_state.filled = end_ds
 
         # Update trajectory traces (accumulate path up to current position)
-        rear_x = [s.x for s in states[: original_idx + 1]]
-        rear_y = [s.y for s in states[: original_idx + 1]]
-        front_x = [s.front_x for s in states[: original_idx + 1]]
-        front_y = [s.front_y for s in states[: original_idx + 1]]
+        rear_trace.set_data(rear_x_buf, rear_y_buf)
+        front_trace.set_data(front_x_buf, front_y_buf)
 
-        rear_trace.set_data(rear_x, rear_y)
-        front_trace.set_data(front_x, front_y)
+        # Bind frame state to locals once - update() runs at animation rate
+        # on the GIL-held GUI thread, so repeated attribute walks add up
+        x = current_state.x
+        y = current_state.y
+        front_x = current_state.front_x
+        front_y = current_state.front_y
+        controller_output = current_state.controller_output
 
         # Update robot positions
-        robot_rear_dot.set_data([current_state.x], [current_state.y])
+        robot_rear_dot.set_data([x], [y])
 
         # Update heading arrow (extend to front wheel position)
-        heading_arrow.set_position((current_state.x, current_state.y))
-        heading_arrow.xy = (current_state.front_x, current_state.front_y)
-
-        # Update controller debug elements (if available)
-        if (
-            target_dot is not None
-            and lookahead_line is not None
-            and current_state.controller_output is not None
-        ):
-            control_output = current_state.controller_output
-            # Only show target point and lookahead if track is still active
-            if not control_output.track_complete:
-                target_dot.set_data(
-                    [control_output.target_point.x], [control_output.target_point.y]
-                )
-                lookahead_line.set_data(
-                    [current_state.x, control_output.target_point.x],
-                    [current_state.y, control_output.target_point.y],
-                )
+        heading_arrow.set_positions((x, y), (front_x, front_y))
+
+        # Update controller debug elements from the per-frame target arrays
+        if target_dot is not None and lookahead_line is not None:
+            target_x = frame_target_x[frame_idx]
+            if not math.isnan(target_x):
+                target_y = frame_target_y[frame_idx]
+                target_dot.set_data([target_x], [target_y])
+                lookahead_line.set_data([x, target_x], [y, target_y])
             else:
                 # Hide target point and lookahead when track is complete
                 target_dot.set_data([], [])
                 lookahead_line.set_data([], [])
 
-        # Update projected path
-        if projected_path_line is not None and current_state.projected_path is not None:
-            projected_path = current_state.projected_path
-            proj_x = [p[0] for p in projected_path]
-            proj_y = [p[1] for p in projected_path]
-            projected_path_line.set_data(proj_x, proj_y)
-
-        # Update time series data
-        times = [s.time for s in states[: original_idx + 1]]
-        steering_angles = [
-            math.degrees(s.steering_angle) for s in states[: original_idx + 1]
-        ]
-        velocities = [s.v for s in states[: original_idx + 1]]
+        # Update projected path - (n, 2) ndarray, sliced per axis
+        projected_path = projected_arrs[frame_idx]
+        if projected_path_line is not None and projected_path is not None:
+            projected_path_line.set_data(projected_path[:, 0], projected_path[:, 1])
 
-        if times:
-            steering_line.set_data(times, steering_angles)
-            velocity_line.set_data(times, velocities)
+        # Time series lines share the progressively filled buffers
+        steering_line.set_data(times_buf, steering_buf)
+        velocity_line.set_data(times_buf, velocity_buf)
 
-            # Update rolling window
+        # Update debug info text from the precomputed degree columns,
+        # throttled - the stale text between refreshes is not noticeable
+        if frame_idx % info_text_stride == 0:
             current_time = current_state.time
-            window_size = 10.0
-            ax_steering.set_xlim(max(0, current_time - window_size), current_time + 1)
-            ax_velocity.set_xlim(max(0, current_time - window_size), current_time + 1)
-
-        # Update debug info text
-        debug_str = f"Step: {frame_idx:4d}  Time: {current_state.time:6.2f}s\n"
-        debug_str += f"Robot: ({current_state.x:6.2f}, {current_state.y:6.2f})  θ: {math.degrees(current_state.theta):6.1f}°\n"
-        debug_str += f"Speed: {current_state.v:5.2f} m/s  Steering: {math.degrees(current_state.steering_angle):6.1f}°"
-
-        if current_state.controller_output is not None:
-            control_output = current_state.controller_output
-            if not control_output.track_complete:
-                debug_str += f"\nTarget: ({control_output.target_point.x:6.2f}, {control_output.target_point.y:6.2f})\n"
-                debug_str += f"Curvature: {control_output.curvature:7.4f}  Active: True"
-            else:
-                debug_str += "\nTrack Complete: True"
+            theta_deg = theta_deg_all[original_idx]
+            steering_deg = steering_deg_all[original_idx]
+            debug_str = f"Step: {frame_idx:4d}  Time: {current_time:6.2f}s\n"
+            debug_str += f"Robot: ({x:6.2f}, {y:6.2f})  θ: {theta_deg:6.1f}°\n"
+            debug_str += (
+                f"Speed: {current_state.v:5.2f} m/s  Steering: {steering_deg:6.1f}°"
+            )
 
-        info_text.set_text(debug_str)
+            if controller_output is not None:
+                if not controller_output.track_complete:
+                    target = controller_output.target_point
+                    debug_str += f"\nTarget: ({target.x:6.2f}, {target.y:6.2f})\n"
+                    debug_str += (
+                        f"Curvature: {controller_output.curvature:7.4f}  Active: True"
+                    )
+                else:
+                    debug_str += "\nTrack Complete: True"
 
-        # Print debug info if enabled
-        if show_debug_info:
-            print(
-                f"Frame {frame_idx:3d}: pos=({current_state.x:6.2f}, {current_state.y:6.2f}), θ={math.degrees(current_state.theta):6.1f}°"
-            )
+            info_text.set_text(debug_str)
 
-        return ()
+        # Print preformatted debug info if enabled, every Nth frame only
+        if show_debug_info and frame_idx % debug_print_stride == 0:
+            print(debug_lines[frame_idx])
+
+        return blit_artists
 
     # Animation setup
     interval = max(10, int(10 / animation_speed))
@@ -498,7 +628,7 @@ def _plot_animated_data(
         update,
         frames=len(animation_states),
         interval=interval,
-        blit=False,
+        blit=True,
         repeat=True,
     )
 
@@ -506,8 +636,18 @@ def _plot_animated_data(
     anim_state.anim = anim
 
     print("Animation looping (use buttons to control or close the window)")
-    plt.show()
-    _ = anim  # Prevent garbage collection
+    try:
+        # Same dense-polyline render settings as the static plot; all frame
+        # draws happen inside this show() loop
+        with _render_rc_context():
+            plt.show()
+    finally:
+        # Drop the figure and the animation's closures (full state list and
+        # trajectory columns) so repeated calls in one session don't
+        # accumulate figures in pyplot's registry
+        anim_state.anim = None
+        del anim
+        plt.close(fig)
     print("\nAnimation stopped!")
 
 
@@ -515,11 +655,14 @@ def _plot_trajectory(
     ax: Axes, data: dict[str, Any], track: Track | None = None
 ) -> None:
     """Plot trajectory with rear and front wheel traces and optional track."""
-    if not data["rear_trajectory"]:
+    rear_x = data["rear_x"]
+    rear_y = data["rear_y"]
+
+    if len(rear_x) == 0:
         # For animation setup, just configure the axis
         if track is not None:
-            track_x = [waypoint.x for waypoint in track.data]
-            track_y = [waypoint.y for waypoint in track.data]
+            track_x = track.xy[:, 0]
+            track_y = track.xy[:, 1]
             ax.plot(track_x, track_y, "k-", linewidth=3, label="Track", alpha=0.5)
             ax.plot(track_x, track_y, "ko", markersize=6, alpha=0.5)
 
@@ -530,14 +673,14 @@ def _plot_trajectory(
         ax.set_title("Vehicle Trajectory")
         return
 
-    # Extract coordinates for static plotting
-    rear_x, rear_y = zip(*data["rear_trajectory"], strict=False)
-    front_x, front_y = zip(*data["front_trajectory"], strict=False)
+    front_x = data["front_x"]
+    front_y = data["front_y"]
 
-    # Plot track waypoints first (so they appear behind the trajectory)
+    # Plot track waypoints first (so they appear behind the trajectory) -
+    # column views of the track's canonical coordinate array, no boxing
     if track is not None:
-        track_x = [waypoint.x for waypoint in track.data]
-        track_y = [waypoint.y for waypoint in track.data]
+        track_x = track.xy[:, 0]
+        track_y = track.xy[:, 1]
         ax.plot(track_x, track_y, "k-", linewidth=3, label="Track", alpha=0.5)
         ax.plot(track_x, track_y, "ko", markersize=6, alpha=0.5)
 
@@ -549,22 +692,26 @@ def _plot_trajectory(
     ax.plot(rear_x[0], rear_y[0], "go", markersize=8, label="Start")
     ax.plot(rear_x[-1], rear_y[-1], "ro", markersize=8, label="End")
 
-    # Calculate bounds with padding (include track waypoints if present)
-    all_x = list(rear_x) + list(front_x)
-    all_y = list(rear_y) + list(front_y)
+    # Calculate bounds with padding via array reductions (include track
+    # waypoints if present) - no concatenated Python lists
+    x_min_data = min(float(rear_x.min()), float(front_x.min()))
+    x_max_data = max(float(rear_x.max()), float(front_x.max()))
+    y_min_data = min(float(rear_y.min()), float(front_y.min()))
+    y_max_data = max(float(rear_y.max()), float(front_y.max()))
 
     if track is not None:
-        track_x = [waypoint.x for waypoint in track.data]
-        track_y = [waypoint.y for waypoint in track.data]
-        all_x.extend(track_x)
-        all_y.extend(track_y)
+        track_xy = track.xy
+        x_min_data = min(x_min_data, float(track_xy[:, 0].min()))
+        x_max_data = max(x_max_data, float(track_xy[:, 0].max()))
+        y_min_data = min(y_min_data, float(track_xy[:, 1].min()))
+        y_max_data = max(y_max_data, float(track_xy[:, 1].max()))
 
-    x_range = max(all_x) - min(all_x)
+    x_range = x_max_data - x_min_data
 
     # Calculate horizontal bounds with margin
     horizontal_margin = x_range * 0.05 + 1.0  # 5% + 1m minimum
-    x_min = min(all_x) - horizontal_margin
-    x_max = max(all_x) + horizontal_margin
+    x_min = x_min_data - horizontal_margin
+    x_max = x_max_data + horizontal_margin
     x_span = x_max - x_min
 
     # For static plot, we have a 2-column layout, so trajectory plot gets roughly half the figure width
@@ -574,7 +721,7 @@ def _plot_trajectory(
     y_span_for_full_height = x_span / plot_aspect_ratio
 
     # Center the y range around the track, but expand to use full vertical space
-    y_center = (min(all_y) + max(all_y)) / 2
+    y_center = (y_min_data + y_max_data) / 2
     y_min = y_center - y_span_for_full_height / 2
     y_max = y_center + y_span_for_full_height / 2
 
@@ -602,30 +749,29 @@ def _plot_time_series(ax_container: Axes, data: dict[str, Any], fig: Figure) ->
 
     times = data["times"]
 
-    if not times:
+    if len(times) == 0:
         return
 
+    steering_angles = data["steering_angles"]
+    velocities = data["velocities"]
+
     # Upper plot: Steering angle vs time
-    ax_steering.plot(times, data["steering_angles"], "g-", linewidth=2)
+    ax_steering.plot(times, steering_angles, "g-", linewidth=2)
 
     # Set steering limits to 110% of max absolute steering angle
-    if data["steering_angles"]:
-        max_abs_steering = max(abs(angle) for angle in data["steering_angles"])
-        steering_limit = max_abs_steering * 1.1
-        ax_steering.set_ylim(-steering_limit, steering_limit)
+    steering_limit = float(np.abs(steering_angles).max()) * 1.1
+    ax_steering.set_ylim(-steering_limit, steering_limit)
 
     ax_steering.grid(True, alpha=0.3)
     ax_steering.set_ylabel("Steering Angle (°)")
     ax_steering.set_title("Steering Dynamics")
 
     # Lower plot: Velocity vs time
-    ax_velocity.plot(times, data["velocities"], "m-", linewidth=2)
+    ax_velocity.plot(times, velocities, "m-", linewidth=2)
 
     # Set velocity limits to 110% of max velocity
-    if data["velocities"]:
-        max_velocity = max(data["velocities"])
-        velocity_limit = max_velocity * 1.1
-        ax_velocity.set_ylim(0, velocity_limit)
+    velocity_limit = float(velocities.max()) * 1.1
+    ax_velocity.set_ylim(0, velocity_limit)
 
     ax_velocity.grid(True, alpha=0.3)
     ax_velocity.set_xlabel("Time (s)")
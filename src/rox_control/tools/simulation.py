@@ -5,56 +5,345 @@ Simulation utility functions for robotics examples.
 Copyright (c) 2025 ROX Automation - Jev Kuznetsov
 """
 
-import math
-from dataclasses import dataclass
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from rox_control.tools.bicicle_model import RobotState
+import numpy as np
+
+from rox_control.tools.bicicle_model import (
+    COL_FRONT_X,
+    COL_FRONT_Y,
+    COL_STEER,
+    COL_THETA,
+    COL_TIME,
+    COL_V,
+    COL_X,
+    COL_Y,
+    RobotState,
+)
 from rox_control.track import Track
 
 if TYPE_CHECKING:  # pragma: no cover
     from rox_control.controllers.pure_pursuit_a import ControlOutput
 
 
-@dataclass(frozen=True)
+class TrajectoryBuffer:
+    """Preallocated structure-of-arrays storage for simulation trajectories.
+
+    Stores the trajectory as one (capacity, 8) float64 array with the COL_*
+    column layout from the bicycle model kernels, so integration kernels can
+    write blocks directly and downstream consumers (printing, plotting) can
+    read whole columns without touching per-step RobotState objects.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty buffer with room for `capacity` states."""
+        self._data = np.empty((capacity, 8), dtype=np.float64)
+        self._size = 0
+
+    def append_state(self, state: RobotState) -> None:
+        """Append a single RobotState to the buffer."""
+        row = self._data[self._size]
+        row[COL_X] = state.x
+        row[COL_Y] = state.y
+        row[COL_THETA] = state.theta
+        row[COL_V] = state.v
+        row[COL_STEER] = state.steering_angle
+        row[COL_TIME] = state.time
+        row[COL_FRONT_X] = state.front_x
+        row[COL_FRONT_Y] = state.front_y
+        self._size += 1
+
+    def append_block(self, block: np.ndarray) -> None:
+        """Append an (n, 8) trajectory block produced by an integration kernel."""
+        n = block.shape[0]
+        self._data[self._size : self._size + n] = block
+        self._size += n
+
+    def reserve(self, n: int) -> np.ndarray:
+        """Reserve a writable (n, 8) region at the end of the buffer.
+
+        Returns: View into the underlying array for kernels to fill in place.
+        """
+        view = self._data[self._size : self._size + n]
+        if view.shape[0] < n:
+            raise ValueError("TrajectoryBuffer capacity exceeded")
+        self._size += n
+        return view
+
+    def __len__(self) -> int:
+        """Get number of states currently stored.
+
+        Returns: Number of states.
+        """
+        return self._size
+
+    def __getitem__(self, i: int) -> RobotState:
+        """Materialize a single row as a RobotState (lazy AoS view).
+
+        Returns: RobotState for row i.
+        """
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError("TrajectoryBuffer index out of range")
+        row = self._data[i]
+        return RobotState(
+            x=row[COL_X],
+            y=row[COL_Y],
+            theta=row[COL_THETA],
+            v=row[COL_V],
+            steering_angle=row[COL_STEER],
+            time=row[COL_TIME],
+            front_x=row[COL_FRONT_X],
+            front_y=row[COL_FRONT_Y],
+        )
+
+    def __iter__(self) -> "Iterator[RobotState]":
+        """Iterate over stored states as lazily materialized RobotState objects."""
+        for i in range(self._size):
+            yield self[i]
+
+    @property
+    def x(self) -> np.ndarray:
+        """X position column (zero-copy view)."""
+        return self._data[: self._size, COL_X]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Y position column (zero-copy view)."""
+        return self._data[: self._size, COL_Y]
+
+    @property
+    def theta(self) -> np.ndarray:
+        """Orientation column in radians (zero-copy view)."""
+        return self._data[: self._size, COL_THETA]
+
+    @property
+    def v(self) -> np.ndarray:
+        """Velocity column (zero-copy view)."""
+        return self._data[: self._size, COL_V]
+
+    @property
+    def steering_angle(self) -> np.ndarray:
+        """Steering angle column in radians (zero-copy view)."""
+        return self._data[: self._size, COL_STEER]
+
+    @property
+    def time(self) -> np.ndarray:
+        """Simulation time column (zero-copy view)."""
+        return self._data[: self._size, COL_TIME]
+
+    @property
+    def front_x(self) -> np.ndarray:
+        """Front wheel X column (zero-copy view)."""
+        return self._data[: self._size, COL_FRONT_X]
+
+    @property
+    def front_y(self) -> np.ndarray:
+        """Front wheel Y column (zero-copy view)."""
+        return self._data[: self._size, COL_FRONT_Y]
+
+
+@dataclass(frozen=True, slots=True)
 class SimulationState(RobotState):
     """Extended robot state with optional debug data for visualization."""
 
     controller_output: "ControlOutput | None" = None
-    projected_path: list[tuple[float, float]] | None = None
+    # (n_points, 2) x/y coordinates; excluded from __eq__ - ndarray
+    # comparison is elementwise and would make state equality ambiguous
+    projected_path: np.ndarray | None = field(default=None, compare=False)
+
+    @classmethod
+    def from_robot_state(
+        cls,
+        state: RobotState,
+        controller_output: "ControlOutput | None" = None,
+        projected_path: np.ndarray | None = None,
+    ) -> "SimulationState":
+        """Extend a RobotState with debug data via explicit field copy.
+
+        Returns: SimulationState with the same kinematic state.
+        """
+        return cls(
+            x=state.x,
+            y=state.y,
+            theta=state.theta,
+            v=state.v,
+            steering_angle=state.steering_angle,
+            time=state.time,
+            front_x=state.front_x,
+            front_y=state.front_y,
+            controller_output=controller_output,
+            projected_path=projected_path,
+        )
 
 
 @dataclass(frozen=True)
 class SimulationData:
-    """Pre-computed simulation data for visualization."""
+    """Pre-computed simulation data for visualization.
+
+    Exposes cached columnar NumPy views over the state list so downstream
+    consumers (tables, plots, stats) can work on whole arrays instead of
+    iterating per-step Python objects. No slots here - cached_property needs
+    the instance __dict__, and there is one SimulationData per run anyway.
+    """
 
     states: list[SimulationState]
     track: Track | None = None
 
+    @cached_property
+    def _kinematics(self) -> np.ndarray:
+        """Columnar (N, 8) array of time, x, y, theta, v, steering_angle, front_x/y.
 
-def present_results(states: list["RobotState"], execution_time: float) -> None:
-    """Present simulation results in a formatted way."""
+        Returns: Array built in one gather pass over the states, then cached.
+        """
+        return np.array(
+            [
+                (s.time, s.x, s.y, s.theta, s.v, s.steering_angle, s.front_x, s.front_y)
+                for s in self.states
+            ],
+            dtype=np.float64,
+        )
 
-    def print_states_table(states: list["RobotState"], nr_rows: int = 10) -> None:
-        """Print states in a nicely formatted table."""
-        print(
-            f"{'Time':>6} {'X':>8} {'Y':>8} {'Theta':>8} {'Velocity':>8} {'Steering':>8}"
+    @property
+    def time(self) -> np.ndarray:
+        """Simulation time column."""
+        return self._kinematics[:, 0]
+
+    @property
+    def x(self) -> np.ndarray:
+        """X position column."""
+        return self._kinematics[:, 1]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Y position column."""
+        return self._kinematics[:, 2]
+
+    @property
+    def theta(self) -> np.ndarray:
+        """Orientation column in radians."""
+        return self._kinematics[:, 3]
+
+    @property
+    def v(self) -> np.ndarray:
+        """Velocity column."""
+        return self._kinematics[:, 4]
+
+    @property
+    def steering_angle(self) -> np.ndarray:
+        """Steering angle column in radians."""
+        return self._kinematics[:, 5]
+
+    @property
+    def front_x(self) -> np.ndarray:
+        """Front wheel X column."""
+        return self._kinematics[:, 6]
+
+    @property
+    def front_y(self) -> np.ndarray:
+        """Front wheel Y column."""
+        return self._kinematics[:, 7]
+
+    @cached_property
+    def theta_deg(self) -> np.ndarray:
+        """Orientation column converted to degrees.
+
+        Returns: (N,) float64 array, converted once and cached.
+        """
+        return np.degrees(self.theta)
+
+    @cached_property
+    def steering_deg(self) -> np.ndarray:
+        """Steering angle column converted to degrees.
+
+        Returns: (N,) float64 array, converted once and cached.
+        """
+        return np.degrees(self.steering_angle)
+
+    @cached_property
+    def curvature(self) -> np.ndarray:
+        """Controller curvature command column (NaN where no output recorded).
+
+        Returns: (N,) float64 array, cached.
+        """
+        return np.array(
+            [
+                s.controller_output.curvature if s.controller_output else np.nan
+                for s in self.states
+            ],
+            dtype=np.float64,
         )
-        print(
-            f"{'(s)':>6} {'(m)':>8} {'(m)':>8} {'(deg)':>8} {'(m/s)':>8} {'(deg)':>8}"
+
+    @cached_property
+    def target_xy(self) -> np.ndarray:
+        """Controller target point columns as an (N, 2) array (NaN where absent).
+
+        Returns: Array of lookahead target coordinates, cached.
+        """
+        return np.array(
+            [
+                (s.controller_output.target_point.x, s.controller_output.target_point.y)
+                if s.controller_output
+                else (np.nan, np.nan)
+                for s in self.states
+            ],
+            dtype=np.float64,
         )
-        print("-" * 54)
 
+
+def present_results(
+    states: "list[RobotState] | TrajectoryBuffer", execution_time: float
+) -> None:
+    """Present simulation results in a formatted way."""
+
+    def print_states_table(
+        states: "list[RobotState] | TrajectoryBuffer", nr_rows: int = 10
+    ) -> None:
+        """Print states in a nicely formatted table."""
         # Calculate subsample automatically based on desired number of rows
         subsample = max(1, len(states) // nr_rows)
 
-        for i, state in enumerate(states):
-            if i % subsample == 0:
-                print(
-                    f"{state.time:6.1f} {state.x:8.2f} {state.y:8.2f} "
-                    f"{math.degrees(state.theta):8.1f} {state.v:8.2f} "
-                    f"{math.degrees(state.steering_angle):8.1f}"
-                )
+        # Pull subsampled columns as arrays - zero-copy slices for a
+        # TrajectoryBuffer, one gather pass for a legacy state list
+        if isinstance(states, TrajectoryBuffer):
+            t = states.time[::subsample]
+            x = states.x[::subsample]
+            y = states.y[::subsample]
+            theta = states.theta[::subsample]
+            v = states.v[::subsample]
+            steering = states.steering_angle[::subsample]
+        else:
+            rows = states[::subsample]
+            t = np.array([s.time for s in rows])
+            x = np.array([s.x for s in rows])
+            y = np.array([s.y for s in rows])
+            theta = np.array([s.theta for s in rows])
+            v = np.array([s.v for s in rows])
+            steering = np.array([s.steering_angle for s in rows])
+
+        # Vectorized unit conversion instead of math.degrees per row
+        theta_deg = np.degrees(theta)
+        steering_deg = np.degrees(steering)
+
+        lines = [
+            f"{'Time':>6} {'X':>8} {'Y':>8} {'Theta':>8} {'Velocity':>8} {'Steering':>8}",
+            f"{'(s)':>6} {'(m)':>8} {'(m)':>8} {'(deg)':>8} {'(m/s)':>8} {'(deg)':>8}",
+            "-" * 54,
+        ]
+        lines.extend(
+            f"{ti:6.1f} {xi:8.2f} {yi:8.2f} {thi:8.1f} {vi:8.2f} {si:8.1f}"
+            for ti, xi, yi, thi, vi, si in zip(
+                t, x, y, theta_deg, v, steering_deg, strict=True
+            )
+        )
+
+        # Single write instead of one print syscall per row
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print("\nSimulation Results")
     print("=" * 54)
@@ -1,63 +1,334 @@
 #!/usr/bin/env python3
 """Track class for waypoint management in robotics path following."""
 
-from collections import UserList
-from typing import Sequence
+import math
+from collections.abc import Iterator, Sequence
+from typing import overload
 
+import numpy as np
 from rox_vectors import Vector
 
+from rox_control._jit import HAS_NUMBA, njit
 
-class Track(UserList):
-    """Navigation waypoints collection with path tracking functionality."""
+# Number of segments ahead of the last match searched before falling
+# back to a full-track scan
+_HINT_WINDOW = 9
 
-    def __init__(self, waypoints: Sequence[Vector | tuple[float, float]]):
-        """Initialize Track with waypoints as Vector objects or (x, y) tuples."""
-        # Convert all waypoints to Vector objects
-        converted_waypoints = [
-            Vector(*wp) if isinstance(wp, (tuple, list)) else wp for wp in waypoints
+
+def _closest_segment_numpy(
+    xy: np.ndarray, rx: float, ry: float
+) -> tuple[int, float, float, float]:
+    """Vectorized closest-segment search used when numba is unavailable.
+
+    Projects (rx, ry) onto all segments at once with NumPy ufuncs instead of
+    looping per segment in the interpreter. Like the JIT kernel (and the
+    original point_on_line scorer) the projection parameter is deliberately
+    not clamped to the segment, so both code paths rank segments by distance
+    to the segment's infinite line and always agree.
+
+    Returns: (segment_idx, projected_x, projected_y, distance_along_segment).
+    """
+    a = xy[:-1]
+    ab = xy[1:] - a
+    ab2 = (ab * ab).sum(axis=1)
+
+    # Guard zero-length segments - their projection falls back to the waypoint
+    valid = ab2 > 0.0
+    t = ((rx - a[:, 0]) * ab[:, 0] + (ry - a[:, 1]) * ab[:, 1]) / np.where(
+        valid, ab2, 1.0
+    )
+    t = np.where(valid, t, 0.0)
+
+    px = a[:, 0] + t * ab[:, 0]
+    py = a[:, 1] + t * ab[:, 1]
+    d2 = (rx - px) ** 2 + (ry - py) ** 2
+
+    i = int(d2.argmin())
+    distance_along = abs(t[i]) * math.sqrt(ab2[i])
+    return i, float(px[i]), float(py[i]), float(distance_along)
+
+
+@njit(cache=True)  # type: ignore[misc]
+def _closest_segment_kernel(
+    xy: np.ndarray, rx: float, ry: float, early_exit_d2: float = 0.0
+) -> tuple[int, float, float, float]:
+    """Find closest segment to (rx, ry) over an (M, 2) waypoint array.
+
+    When early_exit_d2 is positive, the scan stops at the first segment whose
+    squared projection distance falls below it - under normal path following
+    no later segment can be meaningfully closer.
+
+    Returns: (segment_idx, projected_x, projected_y, distance_along_segment).
+    """
+    min_d2 = np.inf
+    best_idx = 0
+    best_px = xy[0, 0]
+    best_py = xy[0, 1]
+    best_along = 0.0
+
+    for i in range(xy.shape[0] - 1):
+        ax = xy[i, 0]
+        ay = xy[i, 1]
+        abx = xy[i + 1, 0] - ax
+        aby = xy[i + 1, 1] - ay
+        ab2 = abx * abx + aby * aby
+
+        if ab2 > 0.0:
+            # Project robot position onto the segment's line
+            t = ((rx - ax) * abx + (ry - ay) * aby) / ab2
+            px = ax + t * abx
+            py = ay + t * aby
+            along = abs(t) * math.sqrt(ab2)
+        else:
+            # Degenerate zero-length segment - fall back to the waypoint
+            px = ax
+            py = ay
+            along = 0.0
+
+        dx = rx - px
+        dy = ry - py
+        d2 = dx * dx + dy * dy
+
+        if d2 < min_d2:
+            min_d2 = d2
+            best_idx = i
+            best_px = px
+            best_py = py
+            best_along = along
+
+            if min_d2 < early_exit_d2:
+                break
+
+    return best_idx, best_px, best_py, best_along
+
+
+class Track:
+    """Navigation waypoints collection with path tracking functionality.
+
+    Waypoints are stored canonically as an (M, 2) float64 NumPy array; Vector
+    objects are only boxed at the API boundary (indexing, iteration, `data`),
+    keeping all hot-path math on raw arrays.
+    """
+
+    def __init__(
+        self,
+        waypoints: Sequence[Vector | tuple[float, float]],
+        early_exit_distance: float | None = None,
+    ):
+        """Initialize Track with waypoints as Vector objects or (x, y) tuples.
+
+        When early_exit_distance is set, the closest-segment scan stops at the
+        first segment closer than it - an opt-in shortcut for dense tracks
+        where the robot is known to stay near the path. Only applies to the
+        JIT scan; the vectorized fallback evaluates all candidates anyway.
+        """
+        # Normalize all waypoints to coordinate pairs
+        coords = [
+            (wp.x, wp.y) if isinstance(wp, Vector) else (wp[0], wp[1])
+            for wp in waypoints
         ]
 
+        # Drop consecutive duplicates so downstream kernels can assume
+        # strictly positive segment lengths (no per-iteration guard branch)
+        deduped: list[tuple[float, float]] = []
+        for coord in coords:
+            if not deduped or coord != deduped[-1]:
+                deduped.append(coord)
+
         # Validate minimum waypoint requirement
-        if len(converted_waypoints) < 2:
+        if len(deduped) < 2:
             raise ValueError("Track must contain at least 2 waypoints")
 
-        super().__init__(converted_waypoints)
+        self._xy = np.array(deduped, dtype=np.float64)
+        self._last_idx = 0
+        self._early_exit_d2 = (
+            0.0 if early_exit_distance is None else early_exit_distance**2
+        )
+        self._rebuild_cache()
+
+    @classmethod
+    def from_array(
+        cls, arr: np.ndarray, early_exit_distance: float | None = None
+    ) -> "Track":
+        """Build a Track directly from an (M, 2) coordinate array.
+
+        Fast path for NumPy-produced waypoints that skips the per-element
+        conversion loop. The array is adopted as-is (converted to contiguous
+        float64 only if needed); consecutive duplicate waypoints are rejected
+        rather than silently dropped.
+
+        Returns: Track backed by the given coordinates.
+        """
+        if arr.ndim != 2 or arr.shape[1] != 2:
+            raise ValueError("Expected an (M, 2) coordinate array")
+        if arr.shape[0] < 2:
+            raise ValueError("Track must contain at least 2 waypoints")
+
+        xy = np.ascontiguousarray(arr, dtype=np.float64)
+        if bool((xy[1:] == xy[:-1]).all(axis=1).any()):
+            raise ValueError("Track must not contain consecutive duplicate waypoints")
+
+        track = cls.__new__(cls)
+        track._xy = xy
+        track._last_idx = 0
+        track._early_exit_d2 = (
+            0.0 if early_exit_distance is None else early_exit_distance**2
+        )
+        track._rebuild_cache()
+        return track
+
+    def _rebuild_cache(self) -> None:
+        """Recompute per-segment geometry derived from the coordinate array."""
+        # Per-segment geometry is constant between mutations, so compute it
+        # once here instead of per control tick: lengths, unit direction
+        # vectors and cumulative arc length along the track
+        seg_vec = self._xy[1:] - self._xy[:-1]
+        self._seg_len = np.hypot(seg_vec[:, 0], seg_vec[:, 1])
+        with np.errstate(invalid="ignore"):
+            self._seg_dir = np.where(
+                self._seg_len[:, None] > 0.0,
+                seg_vec / self._seg_len[:, None],
+                0.0,
+            )
+        self._cum_len = np.concatenate(([0.0], np.cumsum(self._seg_len)))
+
+    def __len__(self) -> int:
+        """Number of waypoints.
+
+        Returns: Waypoint count.
+        """
+        return self._xy.shape[0]
+
+    @overload
+    def __getitem__(self, idx: int) -> Vector: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[Vector]: ...
+
+    def __getitem__(self, idx: int | slice) -> Vector | list[Vector]:
+        """Waypoint at index, boxed into a Vector at the API edge.
+
+        Slices return a list of Vectors, matching the UserList-era behavior.
+
+        Returns: Waypoint as a Vector, or list of Vectors for a slice.
+        """
+        if isinstance(idx, slice):
+            return [Vector(row[0], row[1]) for row in self._xy[idx]]
+        row = self._xy[idx]
+        return Vector(row[0], row[1])
+
+    def __iter__(self) -> Iterator[Vector]:
+        """Iterate over waypoints as Vector objects."""
+        for row in self._xy:
+            yield Vector(row[0], row[1])
+
+    def append(self, waypoint: Vector | tuple[float, float]) -> None:
+        """Append a waypoint and refresh the cached segment geometry."""
+        coord = (
+            (waypoint.x, waypoint.y)
+            if isinstance(waypoint, Vector)
+            else (waypoint[0], waypoint[1])
+        )
+        # Skip consecutive duplicates, like __init__, so the documented
+        # positive-segment-length invariant survives mutation
+        if coord == (self._xy[-1, 0], self._xy[-1, 1]):
+            return
+        self._xy = np.vstack((self._xy, np.array(coord, dtype=np.float64)))
+        self._rebuild_cache()
+
+    @property
+    def data(self) -> list[Vector]:
+        """Waypoints as a list of Vector objects (UserList-compatible view).
+
+        Returns: Boxed copy of the waypoint array.
+        """
+        return [Vector(row[0], row[1]) for row in self._xy]
+
+    @property
+    def xy(self) -> np.ndarray:
+        """Waypoint coordinates as an (M, 2) float64 array for numeric kernels.
+
+        Returns: Canonical coordinate array.
+        """
+        return self._xy
+
+    @property
+    def seg_len(self) -> np.ndarray:
+        """Per-segment lengths as an (M-1,) float64 array.
+
+        Returns: Cached length array, rebuilt on waypoint mutation.
+        """
+        return self._seg_len
+
+    @property
+    def seg_dir(self) -> np.ndarray:
+        """Per-segment unit direction vectors as an (M-1, 2) float64 array.
+
+        Returns: Cached direction array, rebuilt on waypoint mutation.
+        """
+        return self._seg_dir
+
+    @property
+    def cum_len(self) -> np.ndarray:
+        """Cumulative arc length at each waypoint as an (M,) float64 array.
+
+        Returns: Cached arc-length array, rebuilt on waypoint mutation.
+        """
+        return self._cum_len
+
+    def reset_hint(self) -> None:
+        """Forget the cached segment index used to window the closest-segment search."""
+        self._last_idx = 0
+
+    def _search_segments(
+        self, rx: float, ry: float, lo: int, hi: int
+    ) -> tuple[int, float, float, float]:
+        """Run the closest-segment search over segments lo..hi-1.
+
+        Returns: (segment_idx, projected_x, projected_y, distance_along_segment).
+        """
+        xy = self._xy[lo : hi + 1]
+        if HAS_NUMBA:
+            idx, px, py, along = _closest_segment_kernel(
+                xy, rx, ry, self._early_exit_d2
+            )
+        else:
+            idx, px, py, along = _closest_segment_numpy(xy, rx, ry)
+        return lo + int(idx), float(px), float(py), float(along)
+
+    def find_closest_segment_xy(
+        self, rx: float, ry: float
+    ) -> tuple[int, float, float, float]:
+        """Find closest track segment to (rx, ry) working on raw floats.
+
+        Fast-path variant of find_closest_segment for inner control loops:
+        takes coordinates directly and returns the projected point unboxed,
+        skipping one Vector round-trip per tick.
+
+        Returns: (segment_idx, projected_x, projected_y, distance_along_segment).
+        """
+        n_seg = len(self._seg_len)
+
+        lo = max(0, self._last_idx - 1)
+        hi = min(n_seg, self._last_idx + _HINT_WINDOW)
+        if hi - lo < n_seg:
+            idx, px, py, along = self._search_segments(rx, ry, lo, hi)
+            if math.hypot(rx - px, ry - py) <= 0.5 * self._seg_len[idx]:
+                self._last_idx = idx
+                return idx, px, py, along
+
+        idx, px, py, along = self._search_segments(rx, ry, 0, n_seg)
+        self._last_idx = idx
+        return idx, px, py, along
 
     def find_closest_segment(self, robot_xy: Vector) -> tuple[int, Vector, float]:
-        """Find closest track segment and project robot position onto it."""
-        if len(self.data) < 2:
-            raise ValueError("Track must have at least 2 waypoints")
-
-        min_distance = float("inf")
-        closest_segment_idx = 0
-        closest_projected_point = Vector(0, 0)
-        closest_distance_along = 0.0
-
-        # Check each segment
-        for i in range(len(self.data) - 1):
-            waypoint_a = self.data[i]
-            waypoint_b = self.data[i + 1]
-
-            # Project robot position onto line segment
-            from rox_vectors.vectors import point_on_line
-
-            projected_point = point_on_line(waypoint_a, waypoint_b, robot_xy)
-
-            # Calculate distance from robot to projected point
-            distance_to_segment = abs(robot_xy - projected_point)
-
-            if distance_to_segment < min_distance:
-                min_distance = distance_to_segment
-                closest_segment_idx = i
-                closest_projected_point = projected_point
-
-                # Calculate distance along segment from waypoint_a to projected point
-                segment_vector = waypoint_b - waypoint_a
-                segment_length = abs(segment_vector)
-                if segment_length > 0:
-                    projection_vector = projected_point - waypoint_a
-                    closest_distance_along = abs(projection_vector)
-                else:
-                    closest_distance_along = 0.0
-
-        return closest_segment_idx, closest_projected_point, closest_distance_along
+        """Find closest track segment and project robot position onto it.
+
+        Between consecutive calls the robot typically stays near the previously
+        returned segment, so a small window around the last result is searched
+        first and accepted when the projection distance is locally plausible.
+        The full track is only rescanned when the windowed result looks wrong
+        (e.g. after a jump in robot position or a call to reset_hint()).
+        """
+        idx, px, py, along = self.find_closest_segment_xy(robot_xy.x, robot_xy.y)
+        return idx, Vector(px, py), along
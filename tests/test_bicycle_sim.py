@@ -7,7 +7,13 @@ Copyright (c) 2025 ROX Automation - Jev Kuznetsov
 
 import math
 
-from rox_control.tools.bicicle_model import BicycleModel, RobotState
+import numpy as np
+
+from rox_control.tools.bicicle_model import (
+    BatchedBicycleModel,
+    BicycleModel,
+    RobotState,
+)
 
 
 class TestBicycleSim:
@@ -771,3 +777,143 @@ class TestBicycleSim:
         assert (
             actual_setpoint != expected_steering
         )  # Should be different due to clamping
+
+    def test_integrate_maneuver_matches_stepwise(self) -> None:
+        """
+        Test that integrate_maneuver produces the same trajectory as repeated step().
+
+        Rationale: integrate_maneuver runs the whole integration loop inside a
+        JIT-compiled kernel for speed. It must remain numerically equivalent to
+        the reference per-step API, including rate limiting and clamping.
+        """
+        dt = 0.01
+        n_steps = 300
+        target_v = 3.0
+        target_steer = math.radians(20)
+
+        # Reference: per-step integration
+        ref = BicycleModel(wheelbase=2.0, accel=2.0)
+        ref.set_target_velocity(target_v)
+        ref.set_target_steering_angle(target_steer)
+        ref_states = [ref.step(dt) for _ in range(n_steps)]
+
+        # Fused kernel integration
+        sim = BicycleModel(wheelbase=2.0, accel=2.0)
+        buf = sim.integrate_maneuver(target_v, target_steer, dt, n_steps)
+
+        assert buf.shape == (n_steps, 8)
+        for i in [0, n_steps // 2, n_steps - 1]:
+            assert abs(buf[i, 0] - ref_states[i].x) < 1e-9
+            assert abs(buf[i, 1] - ref_states[i].y) < 1e-9
+            assert abs(buf[i, 2] - ref_states[i].theta) < 1e-9
+            assert abs(buf[i, 3] - ref_states[i].v) < 1e-9
+            assert abs(buf[i, 4] - ref_states[i].steering_angle) < 1e-9
+            assert abs(buf[i, 5] - ref_states[i].time) < 1e-9
+
+        # Model state is synced with the last buffer row
+        assert abs(sim.state.x - buf[-1, 0]) < 1e-12
+        assert abs(sim.state.v - sim.velocity_model.val) < 1e-12
+
+    def test_batched_model_matches_scalar(self) -> None:
+        """
+        Test that BatchedBicycleModel reproduces scalar BicycleModel trajectories.
+
+        Rationale: the batched model implements the same rate limiting and
+        kinematics with vectorized ufuncs; each batch lane must evolve exactly
+        like an independent scalar model with the same parameters and targets.
+        """
+        dt = 0.01
+        n_steps = 200
+        targets = [(3.0, math.radians(15)), (5.0, math.radians(-10))]
+
+        # Reference scalar models
+        scalar_states = []
+        for target_v, target_steer in targets:
+            sim = BicycleModel(wheelbase=2.0, accel=2.0)
+            sim.set_target_velocity(target_v)
+            sim.set_target_steering_angle(target_steer)
+            for _ in range(n_steps):
+                sim.step(dt)
+            scalar_states.append(sim.state)
+
+        # Batched model with the same two scenarios
+        batch = BatchedBicycleModel(batch_size=2, wheelbase=2.0, accel=2.0)
+        batch.set_targets(
+            np.array([t[0] for t in targets]), np.array([t[1] for t in targets])
+        )
+        for _ in range(n_steps):
+            batch.step(dt)
+
+        for i, ref in enumerate(scalar_states):
+            assert abs(batch.x[i] - ref.x) < 1e-9
+            assert abs(batch.y[i] - ref.y) < 1e-9
+            assert abs(batch.theta[i] - ref.theta) < 1e-9
+            assert abs(batch.v[i] - ref.v) < 1e-9
+            assert abs(batch.steering_angle[i] - ref.steering_angle) < 1e-9
+
+        front_x, front_y = batch.front_xy
+        assert abs(front_x[0] - scalar_states[0].front_x) < 1e-9
+        assert abs(front_y[0] - scalar_states[0].front_y) < 1e-9
+
+    def test_simulate_matches_stepwise(self) -> None:
+        """
+        Test that simulate() with per-step setpoints matches repeated step().
+
+        Rationale: simulate() runs the whole rollout with varying setpoints
+        inside the JIT kernel; it must stay numerically equivalent to setting
+        targets and stepping one step at a time.
+        """
+        dt = 0.01
+        n_steps = 200
+        targets = np.column_stack(
+            (
+                np.linspace(0.0, 3.0, n_steps),
+                np.radians(np.linspace(-10.0, 20.0, n_steps)),
+            )
+        )
+
+        # Reference: per-step target updates and integration
+        ref = BicycleModel(wheelbase=2.0, accel=2.0)
+        ref_states = []
+        for i in range(n_steps):
+            ref.set_target_velocity(targets[i, 0])
+            ref.set_target_steering_angle(targets[i, 1])
+            ref_states.append(ref.step(dt))
+
+        # Fused rollout
+        sim = BicycleModel(wheelbase=2.0, accel=2.0)
+        buf = sim.simulate(targets, dt)
+
+        assert buf.shape == (n_steps, 8)
+        for i in [0, n_steps // 2, n_steps - 1]:
+            assert abs(buf[i, 0] - ref_states[i].x) < 1e-9
+            assert abs(buf[i, 1] - ref_states[i].y) < 1e-9
+            assert abs(buf[i, 2] - ref_states[i].theta) < 1e-9
+            assert abs(buf[i, 3] - ref_states[i].v) < 1e-9
+            assert abs(buf[i, 4] - ref_states[i].steering_angle) < 1e-9
+
+    def test_make_stepper_matches_step(self) -> None:
+        """
+        Test that the specialized stepper closure matches step(dt).
+
+        Rationale: make_stepper hoists models and parameters into closure
+        locals for tight loops; it must remain numerically identical to
+        calling step with the same fixed time step.
+        """
+        dt = 0.02
+        ref = BicycleModel(wheelbase=2.0, accel=2.0)
+        sim = BicycleModel(wheelbase=2.0, accel=2.0)
+        for model in (ref, sim):
+            model.set_target_velocity(2.5)
+            model.set_target_steering_angle(math.radians(15))
+
+        stepper = sim.make_stepper(dt)
+        for _ in range(100):
+            ref_state = ref.step(dt)
+            state = stepper()
+
+        assert abs(state.x - ref_state.x) < 1e-12
+        assert abs(state.y - ref_state.y) < 1e-12
+        assert abs(state.theta - ref_state.theta) < 1e-12
+        assert abs(state.v - ref_state.v) < 1e-12
+        assert abs(state.steering_angle - ref_state.steering_angle) < 1e-12
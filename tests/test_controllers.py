@@ -7,8 +7,8 @@ import pytest
 from rox_vectors import Vector
 
 from rox_control.controllers import ControlOutput, PurePursuitA
-from rox_control.track import Track
 from rox_control.tools.bicicle_model import RobotState
+from rox_control.track import Track
 
 
 class TestControlOutput:
@@ -251,3 +251,45 @@ class TestIntegrationWithTrack:
         assert isinstance(output1, ControlOutput)
         assert isinstance(output2, ControlOutput)
         assert not output2.track_complete
+
+
+class TestControlBatch:
+    """Test batched controller evaluation against the scalar path."""
+
+    def test_control_batch_matches_control(self):
+        """Batched outputs must match per-tick control() calls."""
+        import numpy as np
+
+        track = Track([(0, 0), (10, 0), (10, 5), (0, 5)])
+        controller = PurePursuitA(look_ahead_distance=2.0)
+        controller.set_track(track)
+
+        states = [
+            RobotState(x=0.5, y=0.2, theta=0.1),
+            RobotState(x=5.0, y=-0.3, theta=0.0),
+            RobotState(x=9.8, y=1.0, theta=math.pi / 2),
+            RobotState(x=8.0, y=5.2, theta=math.pi),
+        ]
+
+        xs = np.array([s.x for s in states])
+        ys = np.array([s.y for s in states])
+        thetas = np.array([s.theta for s in states])
+        curvatures, targets_x, targets_y, angle_errors = controller.control_batch(
+            xs, ys, thetas
+        )
+
+        for i, state in enumerate(states):
+            track.reset_hint()  # scalar path must not reuse windowed hints
+            output = controller.control(state)
+            assert abs(curvatures[i] - output.curvature) < 1e-9
+            assert abs(targets_x[i] - output.target_point.x) < 1e-9
+            assert abs(targets_y[i] - output.target_point.y) < 1e-9
+            assert abs(angle_errors[i] - output.angle_error) < 1e-9
+
+    def test_control_batch_without_track_raises_error(self):
+        """Batch evaluation requires a track, like control()."""
+        import numpy as np
+
+        controller = PurePursuitA()
+        with pytest.raises(ValueError, match="No track set"):
+            controller.control_batch(np.zeros(1), np.zeros(1), np.zeros(1))
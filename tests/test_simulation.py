@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for simulation utilities.
+
+Copyright (c) 2025 ROX Automation - Jev Kuznetsov
+"""
+
+import numpy as np
+import pytest
+
+from rox_control.tools.bicicle_model import BicycleModel, RobotState
+from rox_control.tools.simulation import TrajectoryBuffer, present_results
+
+
+class TestTrajectoryBuffer:
+    """Test cases for the SoA trajectory buffer"""
+
+    def test_append_state_and_getitem(self) -> None:
+        """Test single-state append and lazy RobotState materialization."""
+        buf = TrajectoryBuffer(4)
+        assert len(buf) == 0
+
+        state = RobotState(x=1.0, y=2.0, theta=0.5, v=3.0, steering_angle=0.1, time=0.2)
+        buf.append_state(state)
+
+        assert len(buf) == 1
+        assert buf[0] == state
+        assert buf[-1] == state  # Negative indexing for legacy callers
+
+        with pytest.raises(IndexError):
+            buf[1]
+
+    def test_append_block_from_kernel(self) -> None:
+        """Test that kernel trajectory blocks are stored without conversion."""
+        model = BicycleModel()
+        block = model.integrate_maneuver(2.0, 0.1, 0.01, 100)
+
+        buf = TrajectoryBuffer(101)
+        buf.append_state(RobotState())
+        buf.append_block(block)
+
+        assert len(buf) == 101
+        # Column views match the block contents
+        assert np.allclose(buf.x[1:], block[:, 0])
+        assert np.allclose(buf.time[1:], block[:, 5])
+        # Materialized row matches model end state
+        assert abs(buf[-1].x - model.state.x) < 1e-12
+
+    def test_reserve_writes_in_place(self) -> None:
+        """Test that kernels can fill a reserved region without copies."""
+        model = BicycleModel()
+        buf = TrajectoryBuffer(51)
+        buf.append_state(model.state)
+
+        model.integrate_maneuver(2.0, 0.1, 0.01, 50, out=buf.reserve(50))
+
+        assert len(buf) == 51
+        assert abs(buf[-1].x - model.state.x) < 1e-12
+
+        with pytest.raises(ValueError):
+            buf.reserve(1)  # Capacity exhausted
+
+    def test_column_views_are_zero_copy(self) -> None:
+        """Test that column properties are views into the underlying buffer."""
+        buf = TrajectoryBuffer(2)
+        buf.append_state(RobotState(x=1.0))
+        buf.append_state(RobotState(x=2.0))
+
+        col = buf.x
+        assert col.base is not None  # View, not a copy
+        assert list(col) == [1.0, 2.0]
+
+    def test_present_results_accepts_buffer(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test that present_results works with a TrajectoryBuffer."""
+        buf = TrajectoryBuffer(3)
+        for i in range(3):
+            buf.append_state(RobotState(x=float(i), time=float(i)))
+
+        present_results(buf, 0.1)
+        output = capsys.readouterr().out
+        assert "Simulation Results" in output
+        assert "States generated: 3" in output
+
+
+class TestSimulationDataColumns:
+    """Test columnar views over SimulationData."""
+
+    def test_columns_match_states(self) -> None:
+        """Columnar arrays must mirror the per-state attributes."""
+        from rox_control.tools.simulation import SimulationData, SimulationState
+
+        states = [
+            SimulationState.from_robot_state(
+                RobotState(x=float(i), y=2.0 * i, theta=0.1 * i, v=1.0, time=0.01 * i)
+            )
+            for i in range(5)
+        ]
+        data = SimulationData(states=states)
+
+        assert np.allclose(data.x, [s.x for s in states])
+        assert np.allclose(data.y, [s.y for s in states])
+        assert np.allclose(data.theta, [s.theta for s in states])
+        assert np.allclose(data.time, [s.time for s in states])
+
+        # No controller outputs recorded - curvature column is all NaN
+        assert np.all(np.isnan(data.curvature))
+        assert data.target_xy.shape == (5, 2)
+
+    def test_equality_ignores_projected_path(self) -> None:
+        """States carrying projected-path arrays must still support ==."""
+        from rox_control.tools.simulation import SimulationState
+
+        base = RobotState(x=1.0, y=2.0, theta=0.3)
+        a = SimulationState.from_robot_state(base, projected_path=np.zeros((4, 2)))
+        b = SimulationState.from_robot_state(base, projected_path=np.ones((4, 2)))
+
+        assert a == b
+        assert a != SimulationState.from_robot_state(
+            RobotState(x=9.0, y=2.0, theta=0.3)
+        )
@@ -131,6 +131,13 @@ class TestTrackUserListBehavior:
         assert track[2] == Vector(2, 0)
         assert track[-1] == Vector(2, 0)
 
+    def test_slicing(self):
+        """Test list-like slicing behavior."""
+        track = Track([Vector(0, 0), Vector(1, 1), Vector(2, 0)])
+
+        assert track[1:3] == [Vector(1, 1), Vector(2, 0)]
+        assert track[::-1] == [Vector(2, 0), Vector(1, 1), Vector(0, 0)]
+
     def test_length(self):
         """Test len() functionality."""
         waypoints = [Vector(0, 0), Vector(1, 1), Vector(2, 0)]
@@ -199,3 +206,166 @@ class TestTrackEdgeCases:
         )
         assert isinstance(segment_idx, int)
         assert 0 <= segment_idx < len(waypoints) - 1
+
+
+class TestSegmentSearchHint:
+    """Test the windowed search around the previously matched segment."""
+
+    @staticmethod
+    def _circle_waypoints(n=30, radius=10.0):
+        import math
+
+        return [
+            (
+                radius * math.cos(2 * math.pi * i / n),
+                radius * math.sin(2 * math.pi * i / n),
+            )
+            for i in range(n)
+        ]
+
+    def test_hinted_search_matches_full_scan(self):
+        """Walking along a long track must return the same segments as fresh scans."""
+        waypoints = self._circle_waypoints()
+        track = Track(waypoints)
+        mids = (track.xy[:-1] + track.xy[1:]) * 0.5
+
+        for i in range(len(mids)):
+            robot = Vector(mids[i, 0], mids[i, 1])
+            segment_idx, _, _ = track.find_closest_segment(robot)
+            assert segment_idx == i
+
+    def test_jump_triggers_full_rescan(self):
+        """A position far from the hinted window must still find the right segment."""
+        waypoints = self._circle_waypoints()
+        track = Track(waypoints)
+        mids = (track.xy[:-1] + track.xy[1:]) * 0.5
+
+        track.find_closest_segment(Vector(mids[0, 0], mids[0, 1]))  # hint at start
+        segment_idx, _, _ = track.find_closest_segment(Vector(mids[20, 0], mids[20, 1]))
+        assert segment_idx == 20
+
+        track.reset_hint()
+        segment_idx, _, _ = track.find_closest_segment(Vector(mids[20, 0], mids[20, 1]))
+        assert segment_idx == 20
+
+
+class TestEarlyExitThreshold:
+    """Test the opt-in early-exit shortcut in the closest-segment scan."""
+
+    def test_early_exit_matches_full_scan_on_path(self):
+        """On-path queries must return the same segment with and without early exit."""
+        waypoints = [(0, 0), (10, 0), (10, 5), (0, 5)]
+        fast_track = Track(waypoints, early_exit_distance=0.5)
+        full_track = Track(waypoints)
+
+        for robot in [Vector(5, 0.1), Vector(9.9, 2.5), Vector(5, 4.9)]:
+            fast_idx, fast_point, _ = fast_track.find_closest_segment(robot)
+            full_idx, full_point, _ = full_track.find_closest_segment(robot)
+            assert fast_idx == full_idx
+            assert fast_point == full_point
+
+
+class TestClosestSegmentImplementations:
+    """Test that the JIT and vectorized NumPy searches agree."""
+
+    def test_numpy_fallback_matches_kernel(self):
+        """Both implementations must return identical results."""
+        from rox_control.track import _closest_segment_kernel, _closest_segment_numpy
+
+        track = Track([(0, 0), (10, 0), (10, 5), (0, 5), (0, 0)])
+        queries = [(1.0, -0.5), (10.5, 2.0), (5.0, 5.5), (-3.0, -3.0), (0.0, 0.0)]
+
+        for rx, ry in queries:
+            kernel_result = _closest_segment_kernel(track.xy, rx, ry)
+            numpy_result = _closest_segment_numpy(track.xy, rx, ry)
+
+            assert kernel_result[0] == numpy_result[0]
+            for k, n in zip(kernel_result[1:], numpy_result[1:], strict=True):
+                assert abs(k - n) < 1e-12
+
+    def test_numpy_fallback_matches_jit_kernel(self):
+        """Both closest-segment implementations must rank segments identically."""
+        from rox_control.track import _closest_segment_kernel, _closest_segment_numpy
+
+        # The second track is a known divergence trap for clamped-distance
+        # shortcuts: (5.0, 0.1) is far from segment 0 itself but closest to
+        # its infinite line, which is what both scorers rank by
+        tracks = [
+            Track([(0, 0), (10, 0), (10, 5), (0, 5), (0, 0)]),
+            Track([(0, 0), (1, 0), (4, 2), (6, 2)]),
+        ]
+        queries = [
+            (1.0, -0.5),
+            (10.5, 2.0),
+            (5.0, 5.5),
+            (-3.0, -3.0),
+            (0.0, 0.0),
+            (5.0, 0.1),
+        ]
+
+        for track in tracks:
+            for rx, ry in queries:
+                ref = _closest_segment_kernel(track.xy, rx, ry)
+                vec = _closest_segment_numpy(track.xy, rx, ry)
+
+                assert ref[0] == vec[0]
+                for r, v in zip(ref[1:], vec[1:], strict=True):
+                    assert abs(r - v) < 1e-12
+
+    def test_unclamped_line_projection_regression(self):
+        """Regression: (5.0, 0.1) projects onto segment 0's line extension."""
+        track = Track([(0, 0), (1, 0), (4, 2), (6, 2)])
+        segment_idx, projected, _ = track.find_closest_segment(Vector(5.0, 0.1))
+        assert segment_idx == 0
+        assert abs(projected.y) < 1e-12
+
+    def test_xy_cache_rebuilds_on_append(self):
+        """The coordinate cache must follow waypoint mutations."""
+        track = Track([(0, 0), (1, 0)])
+        assert track.xy.shape == (2, 2)
+
+        track.append(Vector(2, 0))
+        assert track.xy.shape == (3, 2)
+        assert track.xy[2, 0] == 2.0
+
+    def test_consecutive_duplicates_dropped(self):
+        """Consecutive duplicate waypoints are filtered at construction."""
+        track = Track([(0, 0), (0, 0), (1, 0), (1, 0), (2, 0)])
+        assert len(track) == 3
+        assert track[1] == Vector(1, 0)
+
+        # Filtering everything below 2 waypoints is an error
+        with pytest.raises(ValueError):
+            Track([(0, 0), (0, 0)])
+
+    def test_append_skips_consecutive_duplicate(self):
+        """Appending the last waypoint again must not create a zero-length segment."""
+        track = Track([(0, 0), (1, 0)])
+        track.append(track[-1])
+
+        assert len(track) == 2
+        assert (track.seg_len > 0.0).all()
+
+
+class TestTrackFromArray:
+    """Test the array fast-path constructor."""
+
+    def test_from_array_roundtrip(self):
+        import numpy as np
+
+        arr = np.array([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)])
+        track = Track.from_array(arr)
+
+        assert len(track) == 3
+        assert track[1] == Vector(1, 0)
+        assert np.allclose(track.seg_len, [1.0, 1.0])
+
+    def test_from_array_validation(self):
+        import numpy as np
+
+        with pytest.raises(ValueError, match=r"\(M, 2\)"):
+            Track.from_array(np.zeros((3, 3)))
+        with pytest.raises(ValueError, match="at least 2 waypoints"):
+            Track.from_array(np.zeros((1, 2)))
+        with pytest.raises(ValueError, match="consecutive duplicate"):
+            Track.from_array(np.array([(0.0, 0.0), (1.0, 0.0), (1.0, 0.0)]))